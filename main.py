@@ -186,6 +186,8 @@ async def main_async(config_path: str, dry_run: bool = False, order_size: float
             bot_token=config.telegram.bot_token,
             chat_id=config.telegram.chat_id,
             enabled=True,
+            webhook_url=config.telegram.webhook_url or None,
+            webhook_port=config.telegram.webhook_port,
         )
         telegram_bot = TelegramBot(telegram_config)
         logger.info("텔레그램 봇 활성화됨")
@@ -106,6 +106,8 @@ class TelegramConfig:
     enabled: bool = False
     bot_token: str = ""
     chat_id: str = ""
+    webhook_url: str = ""  # 비어 있으면 롱폴링
+    webhook_port: int = 8080
 
 
 @dataclass
@@ -347,6 +349,8 @@ class Config:
             enabled=tg_data.get('enabled', config.telegram.enabled),
             bot_token=os.getenv('TELEGRAM_BOT_TOKEN', tg_data.get('bot_token', '')),
             chat_id=os.getenv('TELEGRAM_CHAT_ID', tg_data.get('chat_id', '')),
+            webhook_url=os.getenv('TELEGRAM_WEBHOOK_URL', tg_data.get('webhook_url', '')),
+            webhook_port=int(os.getenv('PORT', tg_data.get('webhook_port', 8080))),
         )
 
         return config
@@ -438,5 +442,6 @@ class Config:
                 'enabled': self.telegram.enabled,
                 'bot_token': '***' if self.telegram.bot_token else '',
                 'chat_id': self.telegram.chat_id,
+                'webhook_url': self.telegram.webhook_url,
             },
         }
@@ -7,11 +7,36 @@
 - 오류 알림
 """
 import asyncio
+import atexit
+import functools
+import html
+import json
+import queue
+import secrets
+import threading
+import time
 import traceback
+from collections import OrderedDict, deque
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Callable, Optional, Dict, Any
+from typing import Awaitable, Callable, Optional, Dict, Any, Tuple, Union
+import aiohttp
+from aiohttp import web
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# orjson이 있으면 빠른 JSON 파싱/직렬화 사용 (선택)
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps  # 공백 없는 UTF-8 bytes 반환
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> bytes:
+        """orjson.dumps와 같은 형식(공백 없음, UTF-8 bytes)으로 직렬화"""
+        return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode()
 
 try:
     from utils.logger import get_logger
@@ -20,6 +45,183 @@ except ImportError:
 
 logger = get_logger('telegram')
 
+# 전송 속도 제한 (텔레그램: 채팅당 초당 1건, 전체 초당 30건)
+_SEND_RATE = 1.0  # 채팅별 초당 토큰 충전량
+_SEND_BURST = 5  # 채팅별 버킷 최대 토큰 수 (짧은 버스트 허용)
+_GLOBAL_SEND_LIMIT = 30  # 1초 구간 내 전체 최대 전송 수
+_BATCH_MAX_LEN = 4000  # 대기 메시지 합치기 최대 길이 (텔레그램 한도 4096자)
+
+# 키보드 없는 짧은 메시지는 GET 쿼리스트링으로 전송 (본문 인코딩 생략)
+# 한글은 퍼센트 인코딩 시 글자당 9바이트이므로 URL이 약 4.6KB를 넘지 않도록 제한
+_GET_MAX_TEXT = 512
+
+# HTTP 연결 풀 크기 (keep-alive로 TLS 핸드셰이크 재사용)
+_HTTP_POOL_SIZE = 20
+_HTTP_KEEPALIVE = 75  # 유휴 연결 유지 시간 (초)
+
+# getUpdates 롱폴링 설정
+_POLL_TIMEOUT = 50  # 텔레그램 최대 롱폴링 시간 (초)
+_POLL_HTTP_TIMEOUT = _POLL_TIMEOUT + 10  # getUpdates HTTP 전체 타임아웃 (롱폴링 응답 여유 포함)
+_POLL_LIMIT = 100  # 한 번에 받을 최대 업데이트 수 (텔레그램 최대값)
+_HANDLER_CONCURRENCY = 8  # 동시에 처리할 최대 업데이트 수
+_ALLOWED_UPDATES = _json_dumps(["message", "callback_query"]).decode()  # 그 외 업데이트는 서버에서 제외
+
+# 같은 버튼 연타 무시 (같은 메시지의 같은 버튼이 이 시간 내 반복되면 처리 생략)
+_CB_DEDUP_SECONDS = 2.0
+_CB_DEDUP_MAX = 256  # 최근 콜백 기록 최대 개수
+
+# 경고 로그를 이미 남긴 허용되지 않은 chat_id 기록 최대 개수
+_UNAUTHORIZED_LOG_MAX = 256
+
+# 주문 크기 메뉴에서 조회한 잔고를 버튼 클릭 시 재사용하는 시간 (초)
+_BALANCE_REUSE_SECONDS = 10.0
+
+# /config 응답 메시지 재사용 시간 (초), 설정 변경 시 즉시 무효화
+_CONFIG_CACHE_SECONDS = 2.0
+
+# 오류 알림 길이 제한 (텔레그램 메시지 한도 4096자 = 헤더 + 오류 내용 + 트레이스백 + 여유)
+_MAX_ERROR_LEN = 500  # 오류 내용 최대 길이
+_MAX_TB = 3000  # 트레이스백 최대 길이
+
+# 오류 알림 묶음 전송 주기 (초), 그 사이 같은 오류는 횟수만 세어 한 번에 전송
+_ERROR_FLUSH_SECONDS = 3.0
+
+# TelegramNotifier 오류 알림 설정
+_NOTIFIER_MAX_TB = 1000  # 트레이스백 최대 길이 (글자)
+_ERROR_DEDUP_SECONDS = 5.0  # 같은 오류 (타입, 메시지) 반복 전송 억제 시간
+_ERROR_DEDUP_MAX = 256  # 최근 오류 기록 최대 개수
+_NOTIFIER_QUEUE_SIZE = 100  # 전송 대기 최대 개수 (초과 시 가장 오래된 메시지 버림)
+_NOTIFIER_DROP_LOG_EVERY = 10  # 버린 메시지 N건마다 경고 로그
+_NOTIFIER_FLUSH_TIMEOUT = 5.0  # 종료 시 남은 알림 전송 대기 최대 시간 (초)
+
+# 상태 리포트 심볼별 템플릿 (format_map으로 채움)
+_SYM_TMPL = "\n<b>[{symbol}]</b>\n  Mid: ${mid_price:,.2f} | Spread: {spread_bps:.1f}bps\n"
+_SYM_BUY_TMPL = "  🟢 BUY: ${price:,.2f}\n"
+_SYM_SELL_TMPL = "  🔴 SELL: ${price:,.2f}\n"
+
+# 고정 안내 메시지
+_MAIN_MENU_MSG = "🤖 <b>StandX Maker Bot</b>\n\n원하는 기능을 선택하세요:"  # /start, /help, /menu
+_STARTUP_MSG = (
+    "🚀 <b>StandX Maker Bot 시작</b>\n\n"
+    "봇이 Railway에서 실행되었습니다.\n\n"
+    "아래 버튼으로 봇을 제어하세요:"
+)
+_SHUTDOWN_TEMPLATE = "🛑 <b>StandX Maker Bot 종료</b>\n\n사유: {reason}"
+
+# 포지션 메시지 조각
+_HDR_POSITIONS = "📊 <b>현재 포지션</b>\n\n"
+_SEP = "━━━━━━━━━━━━━━\n"
+_MSG_NO_POS = "📭 현재 열린 포지션이 없습니다."
+_MSG_NO_POS_TO_CLOSE = "📭 종료할 포지션이 없습니다."
+
+# 콜백 미설정 오류 메시지
+_ERR_POSITIONS_UNSET = "❌ 포지션 조회 기능이 설정되지 않았습니다."
+_ERR_BALANCE_UNSET = "❌ 잔고 조회 기능이 설정되지 않았습니다."
+_ERR_LEV_UNSET = "❌ 레버리지 변경 기능이 설정되지 않았습니다."
+_ERR_STRAT_UNSET = "❌ 전략 변경 기능이 설정되지 않았습니다."
+_ERR_DIST_UNSET = "❌ 주문 거리 변경 기능이 설정되지 않았습니다."
+_ERR_PROT_UNSET = "❌ 체결 보호 설정 기능이 설정되지 않았습니다."
+
+# 상태 리포트 주기 표시 문자열 (초 -> 라벨), 키보드 선택지 포함
+_REPORT_INTERVAL_LABEL = {
+    0: "끄기", 10: "10초", 30: "30초", 60: "1분", 300: "5분",
+    600: "10분", 900: "15분", 1800: "30분",
+}
+
+# 달러 금액 포맷터 (format 바운드 메서드를 한 번만 만들어 재사용)
+_fmt_usd = "${:,.2f}".format
+_fmt_usd0 = "${:,.0f}".format
+_fmt_pnl = "${:+,.2f}".format  # 부호 포함 (PnL 표시용)
+
+
+def _truncate(s: str, n: int) -> str:
+    """n자를 넘으면 뒷부분만 남기기 (트레이스백은 실제 오류 위치가 끝에 있음), 줄 단위로 자름"""
+    if len(s) <= n:
+        return s
+    start = len(s) - n
+    nl = s.find('\n', start)
+    if 0 <= nl < len(s) - 1:
+        start = nl + 1
+    return "...\n" + s[start:]
+
+
+def _json_dumps_str(obj) -> str:
+    """aiohttp json_serialize용 (str 반환)"""
+    return _json_dumps(obj).decode()
+
+
+def _markup_json(keyboard: dict) -> str:
+    """키보드를 reply_markup 필드용 JSON 문자열로 직렬화"""
+    return _json_dumps_str(keyboard)
+
+
+class _LRU(OrderedDict):
+    """최대 개수가 정해진 OrderedDict (넣을 때 맨 뒤로 이동, 초과 시 가장 오래된 항목 제거)"""
+
+    def __init__(self, cap: int):
+        super().__init__()
+        self.cap = cap
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        if len(self) > self.cap:
+            self.popitem(last=False)
+
+
+def _report_interval_label(interval: float) -> str:
+    """리포트 주기 표시 문자열 (표에 없으면 초/분 단위로 계산)"""
+    label = _REPORT_INTERVAL_LABEL.get(interval)
+    if label is None:
+        label = f"{interval}초" if interval < 60 else f"{interval / 60:.0f}분"
+    return label
+
+
+def _safe_handler(fail_label: str, markup_attr: str = '_back_menu_json'):
+    """핸들러 예외 시 '❌ {fail_label}: {e}' 메시지를 키보드(markup_attr 속성)와 함께 전송하는 데코레이터"""
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            try:
+                return await func(self, *args, **kwargs)
+            except Exception as e:
+                self.send_message(f"❌ {fail_label}: {html.escape(str(e), quote=False)}", reply_markup=getattr(self, markup_attr))
+        return wrapper
+    return decorator
+
+
+def _safe_cb(fail_label: str):
+    """설정 변경 콜백용 _safe_handler (오류 시 설정 메뉴 버튼 표시)"""
+    return _safe_handler(fail_label, '_settings_menu_json')
+
+
+async def _maybe_await(result):
+    """코루틴이면 await, 아니면 그대로 반환"""
+    if asyncio.iscoroutine(result):
+        return await result
+    return result
+
+
+class _TokenBucket:
+    """비동기 토큰 버킷 (전송 속도 제한)"""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+
+    async def acquire(self):
+        """토큰 1개 획득 (부족하면 충전될 때까지 대기)"""
+        while True:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep((1 - self._tokens) / self.rate)
+
 
 @dataclass
 class TelegramConfig:
@@ -27,6 +229,8 @@ class TelegramConfig:
     bot_token: str
     chat_id: str
     enabled: bool = True
+    webhook_url: Optional[str] = None  # 설정 시 롱폴링 대신 웹훅으로 업데이트 수신 (공개 HTTPS 주소)
+    webhook_port: int = 8080  # 웹훅 수신 서버 포트
 
 
 class TelegramBot:
@@ -48,9 +252,31 @@ class TelegramBot:
     def __init__(self, config: TelegramConfig):
         self.config = config
         self.base_url = f"https://api.telegram.org/bot{config.bot_token}"
+        self._api_urls: Dict[str, str] = {}  # API 메서드 -> 전체 URL (첫 호출 시 생성)
         self._last_update_id = 0
         self._running = False
         self._poll_task: Optional[asyncio.Task] = None
+        self._webhook_runner = None  # aiohttp.web.AppRunner (웹훅 모드)
+        self._update_tasks: set = set()  # 웹훅으로 받은 업데이트 처리 태스크
+        self._bg_tasks: set = set()  # 결과를 기다리지 않는 API 호출 태스크 (콜백 응답 등)
+        self._handler_sem = asyncio.Semaphore(_HANDLER_CONCURRENCY)  # 업데이트 동시 처리 제한
+
+        # 비동기 HTTP 세션 (첫 API 호출 시 _get_session()에서 생성, stop()에서 종료)
+        self._session: Optional[aiohttp.ClientSession] = None
+
+        # 429 retry_after 동안 모든 API 호출을 멈추기 위한 이벤트 (set = 호출 가능)
+        self._api_ready = asyncio.Event()
+        self._api_ready.set()
+
+        # 전송 큐 (_sender 태스크가 속도 제한을 지키며 순차 전송)
+        self._send_queue: asyncio.Queue = asyncio.Queue()
+        self._send_task: Optional[asyncio.Task] = None
+
+        # 전송 대기 중인 오류 알림 (hash(오류, 트레이스백) -> [오류, 트레이스백, 발생 횟수])
+        self._error_buffer: Dict[int, list] = {}
+        self._error_task: Optional[asyncio.Task] = None
+        self._chat_buckets: Dict[str, _TokenBucket] = {}  # chat_id별 토큰 버킷
+        self._send_times: deque = deque()  # 최근 1초간 전송 시각 (전체 한도용)
 
         # 콜백 함수들
         self._on_stop: Optional[Callable] = None
@@ -74,6 +300,79 @@ class TelegramBot:
         # 상태 리포트 주기 (초), 0이면 비활성화
         self._report_interval: float = 300.0
 
+        # 경고 로그를 이미 남긴 허용되지 않은 chat_id (스팸 시 로그 폭주 방지)
+        self._seen_unauthorized: _LRU = _LRU(_UNAUTHORIZED_LOG_MAX)
+
+        # 최근 처리한 콜백 ((chat_id, message_id, callback_data) -> monotonic 시각), 연타 무시용
+        self._recent_cb: _LRU = _LRU(_CB_DEDUP_MAX)
+
+        # 주문 크기 메뉴에서 마지막으로 조회한 잔고 (monotonic 시각, 잔고 정보)
+        self._last_balance_info: Optional[Tuple[float, dict]] = None
+
+        # 마지막으로 만든 /config 메시지 (monotonic 시각, 메시지)
+        self._config_cache: Optional[Tuple[float, str]] = None
+
+        # 고정 키보드는 미리 직렬화 (전송마다 dict 생성 및 JSON 인코딩 생략)
+        self._back_menu_json = _markup_json(self._get_back_to_menu_keyboard())
+        self._settings_menu_json = _markup_json(self._get_settings_menu_keyboard())
+        self._leverage_json = _markup_json(self._get_leverage_keyboard())
+        self._strategy_json = _markup_json(self._get_strategy_keyboard())
+        self._distance_json = _markup_json(self._get_distance_keyboard())
+        self._protection_json = _markup_json(self._get_protection_keyboard())
+        self._report_interval_json = _markup_json(self._get_report_interval_keyboard())
+        self._closeall_confirm_json = _markup_json(self._get_closeall_confirm_keyboard())
+        self._fill_paused_json = _markup_json(self._get_consecutive_fill_paused_keyboard())
+        self._order_size_json = _markup_json(self._get_order_size_keyboard())
+        # 메인 메뉴는 주문 상태(활성/비활성)별로 두 가지
+        self._main_menu_json: Dict[bool, str] = {
+            enabled: _markup_json(self._get_main_menu_keyboard(enabled))
+            for enabled in (True, False)
+        }
+
+        # 명령어 디스패치 테이블
+        self._commands: Dict[str, Callable[[list], Awaitable]] = {
+            '/status': self._cmd_status,
+            '/stats': self._cmd_stats,
+            '/balance': self._cmd_balance,
+            '/setsize': self._cmd_setsize,
+            '/config': self._cmd_config,
+            '/positions': self._cmd_positions,
+            '/closeall': self._cmd_closeall,
+            '/stop': self._cmd_stop,
+            # /start, /help, /menu 모두 메인 메뉴 표시
+            '/start': self._cmd_menu,
+            '/help': self._cmd_menu,
+            '/menu': self._cmd_menu,
+        }
+
+        # 콜백 디스패치 테이블 (정확히 일치 -> 접두사 순으로 조회)
+        self._cb_exact: Dict[str, Callable] = {
+            'menu': self.send_main_menu,
+            'status': lambda: self._handle_command('/status'),
+            'stats': lambda: self._handle_command('/stats'),
+            'balance': lambda: self._handle_command('/balance'),
+            'positions': lambda: self._handle_command('/positions'),
+            'config': lambda: self._handle_command('/config'),
+            'stop': lambda: self._handle_command('/stop'),
+            # 주문 시작/정지
+            'orders_enable': self._handle_orders_enable,
+            'orders_disable': self._handle_orders_disable,
+            # 포지션 청산
+            'closeall_confirm': self._show_closeall_confirm,
+            'closeall': lambda: self._handle_command('/closeall'),
+            # 주문 크기 설정 메뉴
+            'setsize_menu': self._show_setsize_menu,
+            # 설정 메뉴
+            'settings_menu': self._show_settings_menu,
+            'settings_leverage': self._show_leverage_menu,
+            'settings_strategy': self._show_strategy_menu,
+            'settings_distance': self._show_distance_menu,
+            'settings_protection': self._show_protection_menu,
+            'settings_report': self._show_report_menu,
+            # 연속 체결 정지 해제
+            'reset_consecutive_fill_pause': self._handle_reset_consecutive_fill_pause,
+        }
+
     def set_callbacks(
         self,
         on_stop: Callable = None,
@@ -94,7 +393,14 @@ class TelegramBot:
         is_orders_enabled: Callable = None,
         reset_consecutive_fill_pause: Callable = None,
     ):
-        """콜백 함수 설정"""
+        """콜백 함수 설정
+
+        get_balance, get_positions, close_all_positions는 거래소 REST 호출이므로
+        asyncio.to_thread로 실행한다. 나머지(설정 변경, 주문 활성/비활성 등)는
+        내부에서 asyncio.create_task를 호출하거나 메모리 상태만 다루므로
+        이벤트 루프에서 직접 호출한다. /closeall, /stop의 안내 메시지는 전송 큐에
+        넣기만 하므로 이어지는 disable_orders와 이미 동시에 진행된다.
+        """
         self._on_stop = on_stop
         self._on_start = on_start
         self._get_status = get_status
@@ -121,36 +427,179 @@ class TelegramBot:
         """리포트 주기 변경"""
         self._report_interval = interval
 
-    def send_message(self, text: str, parse_mode: str = "HTML", reply_markup: dict = None) -> bool:
-        """메시지 전송"""
+    def send_message(self, text: str, parse_mode: str = "HTML", reply_markup: Union[dict, str] = None) -> bool:
+        """
+        메시지 전송 (전송 큐에 넣고 즉시 반환)
+
+        실제 HTTP 전송은 _sender 태스크가 속도 제한을 지키며 처리함.
+        reply_markup은 dict 또는 미리 직렬화된 JSON 문자열.
+        """
         if not self.config.enabled:
             return False
 
+        data = {
+            "chat_id": self.config.chat_id,
+            "text": text,
+            "parse_mode": parse_mode,
+        }
+        if reply_markup:
+            if not isinstance(reply_markup, str):
+                reply_markup = _markup_json(reply_markup)
+            data["reply_markup"] = reply_markup
+        self._send_queue.put_nowait(data)
+        return True
+
+    def _send_back(self, text: str) -> bool:
+        """메뉴로 돌아가기 버튼과 함께 메시지 전송"""
+        return self.send_message(text, reply_markup=self._back_menu_json)
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """공유 HTTP 세션 반환 (없거나 닫혔으면 새로 생성)"""
+        session = self._session
+        if session is None or session.closed:
+            session = self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=_HTTP_POOL_SIZE, keepalive_timeout=_HTTP_KEEPALIVE),
+                timeout=aiohttp.ClientTimeout(total=10),
+                json_serialize=_json_dumps_str,
+            )
+        return session
+
+    async def _call_api(self, api_method: str, get: bool = False, timeout: float = 10, **kwargs) -> Tuple[int, dict]:
+        """
+        텔레그램 Bot API 호출
+
+        Returns:
+            (HTTP 상태 코드, 응답 JSON - 파싱 실패 시 빈 dict)
+        """
+        await self._api_ready.wait()
+        url = self._api_urls.get(api_method)
+        if url is None:
+            url = self._api_urls[api_method] = f"{self.base_url}/{api_method}"
+        session = self._get_session()
+        request = session.get if get else session.post
+        async with request(
+            url,
+            timeout=aiohttp.ClientTimeout(total=timeout),
+            **kwargs,
+        ) as response:
+            body = await response.read()
         try:
-            url = f"{self.base_url}/sendMessage"
-            data = {
-                "chat_id": self.config.chat_id,
-                "text": text,
-                "parse_mode": parse_mode,
-            }
-            if reply_markup:
-                import json
-                data["reply_markup"] = json.dumps(reply_markup)
-            response = requests.post(url, data=data, timeout=10)
-            return response.status_code == 200
-        except Exception as e:
-            logger.error(f"텔레그램 메시지 전송 실패: {e}")
-            return False
+            data = _json_loads(body)
+        except ValueError:
+            data = {}
+        if response.status == 429:
+            self._pause_api(self._get_retry_after(data))
+        return response.status, data
+
+    def _pause_api(self, seconds: float):
+        """텔레그램이 알려준 retry_after 동안 모든 API 호출 정지"""
+        ready = self._api_ready
+        if ready.is_set():
+            ready.clear()
+            asyncio.get_running_loop().call_later(seconds, ready.set)
+
+    async def _raw_send(self, data: dict) -> Tuple[int, dict]:
+        """sendMessage 호출 (키보드 없는 짧은 메시지는 GET)"""
+        if "reply_markup" not in data and len(data["text"]) <= _GET_MAX_TEXT:
+            return await self._call_api('sendMessage', get=True, params=data)
+        return await self._call_api('sendMessage', data=data)
+
+    @staticmethod
+    def _get_retry_after(data: dict, default: float = 5.0) -> float:
+        """오류 응답 JSON에서 retry_after(초) 추출"""
+        try:
+            return float(data.get('parameters', {}).get('retry_after', default))
+        except (TypeError, ValueError):
+            return default
+
+    async def _wait_send_slot(self, chat_id: str):
+        """전송 가능할 때까지 대기 (채팅별 토큰 버킷 + 전체 1초 슬라이딩 윈도우)"""
+        bucket = self._chat_buckets.get(chat_id)
+        if bucket is None:
+            bucket = self._chat_buckets[chat_id] = _TokenBucket(rate=_SEND_RATE, burst=_SEND_BURST)
+        await bucket.acquire()
+
+        send_times = self._send_times
+        while True:
+            now = time.monotonic()
+            while send_times and now - send_times[0] >= 1.0:
+                send_times.popleft()
+            if len(send_times) < _GLOBAL_SEND_LIMIT:
+                send_times.append(now)
+                return
+            await asyncio.sleep(1.0 - (now - send_times[0]))
+
+    def _merge_pending(self, data: dict) -> Tuple[dict, list, Optional[dict]]:
+        """
+        큐에 대기 중인 같은 채팅 메시지를 하나로 합치기
+
+        reply_markup은 마지막 메시지에만 붙일 수 있으므로 키보드가 있는 메시지에서 멈춤.
+
+        Returns:
+            (합친 메시지, 합치기 전 원본 메시지 목록, 합치지 못하고 꺼낸 다음 메시지)
+        """
+        parts = [data]
+        while "reply_markup" not in data and not self._send_queue.empty():
+            nxt = self._send_queue.get_nowait()
+            if (
+                nxt["chat_id"] != data["chat_id"]
+                or nxt["parse_mode"] != data["parse_mode"]
+                or len(data["text"]) + len(nxt["text"]) + 2 > _BATCH_MAX_LEN
+            ):
+                return data, parts, nxt
+            data = {**nxt, "text": data["text"] + "\n\n" + nxt["text"]}
+            parts.append(nxt)
+        return data, parts, None
+
+    async def _send_one(self, data: dict) -> int:
+        """메시지 1건 전송 (속도 제한, 429 시 retry_after 만큼 정지 후 한 번 재시도), HTTP 상태 코드 반환"""
+        await self._wait_send_slot(data["chat_id"])
+        status, result = await self._raw_send(data)
+        if status == 429:
+            # _call_api가 retry_after 동안 모든 호출을 멈추므로 바로 한 번 재시도
+            logger.warning("텔레그램 전송 제한 (429) - %.0f초 후 재시도", self._get_retry_after(result))
+            status, result = await self._raw_send(data)
+        if status != 200:
+            logger.error("텔레그램 메시지 전송 실패: HTTP %s %s", status, result.get('description', ''))
+        return status
+
+    async def _sender(self):
+        """전송 큐 처리 (대기 메시지 합치기, 합친 전송이 실패하면 원래 메시지를 하나씩 다시 전송)"""
+        carry = None
+        while True:
+            data = carry or await self._send_queue.get()
+            data, parts, carry = self._merge_pending(data)
+            try:
+                if await self._send_one(data) != 200 and len(parts) > 1:
+                    # 한 메시지의 오류 (HTML 파싱 실패 등)로 나머지까지 잃지 않도록
+                    for part in parts:
+                        await self._send_one(part)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("텔레그램 메시지 전송 실패: %s", e)
+            finally:
+                for _ in parts:
+                    self._send_queue.task_done()
 
-    def _get_main_menu_keyboard(self):
-        """메인 메뉴 인라인 키보드"""
-        # 주문 상태에 따라 버튼 텍스트 변경
-        orders_enabled = False
+    def _orders_enabled_now(self) -> bool:
+        """현재 주문 활성화 상태 (콜백 미설정/오류 시 False)"""
         if self._is_orders_enabled:
             try:
-                orders_enabled = self._is_orders_enabled()
+                return bool(self._is_orders_enabled())
             except:
                 pass
+        return False
+
+    def _main_menu_markup(self) -> str:
+        """현재 주문 상태에 맞는 메인 메뉴 키보드 (직렬화본)"""
+        return self._main_menu_json[self._orders_enabled_now()]
+
+    def _get_main_menu_keyboard(self, orders_enabled: Optional[bool] = None):
+        """메인 메뉴 인라인 키보드"""
+        # 주문 상태에 따라 버튼 텍스트 변경
+        if orders_enabled is None:
+            orders_enabled = self._orders_enabled_now()
 
         if orders_enabled:
             order_btn = {"text": "⏸️ 주문 정지", "callback_data": "orders_disable"}
@@ -318,42 +767,69 @@ class TelegramBot:
 
     def send_main_menu(self, text: str = None):
         """메인 메뉴 전송"""
-        if text is None:
-            text = "🤖 <b>StandX Maker Bot</b>\n\n원하는 기능을 선택하세요:"
-        self.send_message(text, reply_markup=self._get_main_menu_keyboard())
+        if not self.config.enabled:
+            return
+        self.send_message(text or _MAIN_MENU_MSG, reply_markup=self._main_menu_markup())
 
     def send_startup_message(self):
         """시작 메시지 전송"""
-        msg = (
-            "🚀 <b>StandX Maker Bot 시작</b>\n\n"
-            "봇이 Railway에서 실행되었습니다.\n\n"
-            "아래 버튼으로 봇을 제어하세요:"
-        )
-        self.send_message(msg, reply_markup=self._get_main_menu_keyboard())
+        if not self.config.enabled:
+            return
+        self.send_message(_STARTUP_MSG, reply_markup=self._main_menu_markup())
 
     def send_shutdown_message(self, reason: str = "정상 종료"):
         """종료 메시지 전송"""
-        msg = f"🛑 <b>StandX Maker Bot 종료</b>\n\n사유: {reason}"
-        self.send_message(msg)
+        if not self.config.enabled:
+            return
+        self.send_message(_SHUTDOWN_TEMPLATE.format(reason=reason))
 
     def send_error_message(self, error: str, traceback_str: str = None):
-        """오류 메시지 전송"""
-        msg = f"❌ <b>오류 발생</b>\n\n<code>{error}</code>"
-        if traceback_str:
-            # 트레이스백이 너무 길면 자르기
-            if len(traceback_str) > 1000:
-                traceback_str = traceback_str[:1000] + "..."
-            msg += f"\n\n<pre>{traceback_str}</pre>"
-        self.send_message(msg)
+        """오류 메시지 전송 (_ERROR_FLUSH_SECONDS 동안 모아 같은 오류는 한 번만 전송)"""
+        if not self.config.enabled:
+            return
+        key = hash((error, traceback_str))
+        entry = self._error_buffer.get(key)
+        if entry:
+            entry[2] += 1
+        else:
+            self._error_buffer[key] = [error, traceback_str, 1]
+        if self._error_task is None:
+            # 봇 시작 전/종료 후에는 모으지 않고 바로 전송 큐로 넘김 (시작 전 메시지는 stop()에서 전송)
+            self._flush_errors()
+
+    def _flush_errors(self):
+        """모아 둔 오류 알림 전송"""
+        buffer = self._error_buffer
+        if not buffer:
+            return
+        self._error_buffer = {}
+        for error, traceback_str, count in buffer.values():
+            msg = "❌ <b>오류 발생</b>"
+            if count > 1:
+                msg += f" (최근 {_ERROR_FLUSH_SECONDS:.0f}초간 {count}회)"
+            if len(error) > _MAX_ERROR_LEN:
+                error = error[:_MAX_ERROR_LEN] + "..."
+            msg += f"\n\n<code>{html.escape(error, quote=False)}</code>"
+            if traceback_str:
+                msg += f"\n\n<pre>{html.escape(_truncate(traceback_str, _MAX_TB), quote=False)}</pre>"
+            self.send_message(msg)
+
+    async def _error_flusher(self):
+        """오류 알림 묶음 주기적 전송"""
+        while True:
+            await asyncio.sleep(_ERROR_FLUSH_SECONDS)
+            self._flush_errors()
 
     def send_status_report(self, status: Dict[str, Any], with_menu: bool = True):
         """상태 리포트 전송"""
+        if not self.config.enabled:
+            return
         try:
             stats = status.get('stats', {})
             runtime = status.get('runtime_hours', 0)
 
             uptime_percent = stats.get('uptime_percent', 0)
-            msg = (
+            parts = [(
                 f"📊 <b>상태 리포트</b>\n\n"
                 f"⏱ 실행 시간: {runtime:.2f}시간\n"
                 f"📈 업타임: {uptime_percent:.1f}%\n"
@@ -362,7 +838,7 @@ class TelegramBot:
                 f"🔄 재배치: {stats.get('rebalances', 0)}회\n"
                 f"⚠️ 체결: {stats.get('fills', 0)}건\n"
                 f"💰 예상 포인트: {stats.get('estimated_points', 0):.1f}\n"
-            )
+            )]
 
             # 연속 체결 보호 상태 표시
             if status.get('consecutive_fill_paused'):
@@ -372,83 +848,171 @@ class TelegramBot:
                     remaining_str = f"{remaining / 3600:.1f}시간"
                 else:
                     remaining_str = f"{remaining / 60:.0f}분"
-                msg += f"\n🛑 <b>연속체결 {level}단계 일시정지:</b> {remaining_str} 남음\n"
-                msg += f"💡 아래 버튼으로 수동 해제 가능\n"
+                parts.append(f"\n🛑 <b>연속체결 {level}단계 일시정지:</b> {remaining_str} 남음\n")
+                parts.append("💡 아래 버튼으로 수동 해제 가능\n")
 
             # 연속 체결 정지 횟수 표시
             pause_count = stats.get('consecutive_fill_pauses', 0)
             if pause_count > 0:
-                msg += f"⏸ 연속체결 정지: {pause_count}회\n"
+                parts.append(f"⏸ 연속체결 정지: {pause_count}회\n")
 
             # 심볼별 상태
             symbols = status.get('symbols', {})
             for symbol, sym_status in symbols.items():
-                mid_price = sym_status.get('mid_price', 0)
-                spread = sym_status.get('spread_bps', 0)
-                msg += f"\n<b>[{symbol}]</b>\n"
-                msg += f"  Mid: ${mid_price:,.2f} | Spread: {spread:.1f}bps\n"
-
-                if sym_status.get('buy_order'):
-                    buy = sym_status['buy_order']
-                    msg += f"  🟢 BUY: ${buy['price']:,.2f}\n"
-                if sym_status.get('sell_order'):
-                    sell = sym_status['sell_order']
-                    msg += f"  🔴 SELL: ${sell['price']:,.2f}\n"
+                parts.append(_SYM_TMPL.format_map({
+                    'symbol': symbol,
+                    'mid_price': sym_status.get('mid_price', 0),
+                    'spread_bps': sym_status.get('spread_bps', 0),
+                }))
+
+                buy = sym_status.get('buy_order')
+                if buy:
+                    parts.append(_SYM_BUY_TMPL.format_map(buy))
+                sell = sym_status.get('sell_order')
+                if sell:
+                    parts.append(_SYM_SELL_TMPL.format_map(sell))
+
+            msg = "".join(parts)
 
             if with_menu:
                 # 연속 체결 정지 중이면 해제 버튼 표시
                 if status.get('consecutive_fill_paused'):
-                    self.send_message(msg, reply_markup=self._get_consecutive_fill_paused_keyboard())
+                    self.send_message(msg, reply_markup=self._fill_paused_json)
                 else:
-                    self.send_message(msg, reply_markup=self._get_back_to_menu_keyboard())
+                    self._send_back(msg)
             else:
                 self.send_message(msg)
         except Exception as e:
-            logger.error(f"상태 리포트 전송 실패: {e}")
+            logger.error("상태 리포트 전송 실패: %s", e)
 
     async def _poll_updates(self):
         """텔레그램 업데이트 폴링"""
+        # 오류 시 지수 백오프 (1초 → 최대 30초, 성공 시 초기화)
+        backoff = 1.0
         while self._running:
             try:
-                url = f"{self.base_url}/getUpdates"
                 params = {
                     "offset": self._last_update_id + 1,
-                    "timeout": 30,
+                    "timeout": _POLL_TIMEOUT,
+                    "limit": _POLL_LIMIT,
+                    "allowed_updates": _ALLOWED_UPDATES,
                 }
 
-                # ★ 동기 HTTP 요청을 비동기로 실행 (이벤트 루프 블로킹 방지)
-                response = await asyncio.to_thread(
-                    requests.get, url, params=params, timeout=35
+                status, data = await self._call_api(
+                    'getUpdates', get=True, params=params, timeout=_POLL_HTTP_TIMEOUT
                 )
-                if response.status_code != 200:
-                    await asyncio.sleep(5)
+                if status >= 400 or not data.get('ok'):
+                    # 텔레그램이 retry_after를 알려주면 그만큼 대기, 아니면 백오프
+                    await asyncio.sleep(self._get_retry_after(data, default=backoff))
+                    backoff = min(backoff * 2, 30.0)
                     continue
 
-                data = response.json()
-                if not data.get('ok'):
-                    await asyncio.sleep(5)
-                    continue
-
-                for update in data.get('result', []):
-                    self._last_update_id = update['update_id']
-                    await self._handle_update(update)
+                backoff = 1.0
+                result = data.get('result', [])
+                if len(result) >= _POLL_LIMIT:
+                    logger.warning("텔레그램 업데이트 적체: 한 번에 %s건 수신 (최대치)", len(result))
+                # 한 번에 받은 업데이트는 동시에 처리 (동시 처리 수 제한)
+                async with asyncio.TaskGroup() as tg:
+                    for update in result:
+                        self._last_update_id = update['update_id']
+                        tg.create_task(self._bounded_handle(update))
 
             except asyncio.CancelledError:
                 break
+            except asyncio.TimeoutError:
+                # 롱폴링 응답이 늦은 것일 뿐이므로 대기 없이 바로 다시 요청
+                logger.debug("텔레그램 폴링 타임아웃 - 재요청")
             except Exception as e:
-                logger.error(f"텔레그램 폴링 오류: {e}")
-                await asyncio.sleep(5)
+                logger.error("텔레그램 폴링 오류: %s", e)
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 30.0)
 
-    def _answer_callback_query(self, callback_query_id: str, text: str = None):
+    async def _process_update(self, update: dict):
+        """업데이트 처리 (개별 태스크용, 예외는 로그만 남김)"""
+        try:
+            await self._handle_update(update)
+        except Exception as e:
+            logger.error("텔레그램 업데이트 처리 오류: %s", e)
+
+    async def _bounded_handle(self, update: dict):
+        """동시 처리 수(_HANDLER_CONCURRENCY) 안에서 업데이트 처리"""
+        async with self._handler_sem:
+            await self._process_update(update)
+
+    async def run_webhook(self, bind: str = '0.0.0.0', port: Optional[int] = None) -> bool:
+        """
+        웹훅 수신 서버 시작 및 setWebhook 등록
+
+        Args:
+            bind: 수신 서버 바인드 주소
+            port: 수신 포트 (None이면 config.webhook_port)
+
+        Returns:
+            성공 여부 (실패 시 롱폴링으로 대체)
+        """
+        if port is None:
+            port = self.config.webhook_port
+        secret = secrets.token_urlsafe(32)
+        path = f"/telegram/{secret}"
+
+        async def handle(request):
+            if request.headers.get('X-Telegram-Bot-Api-Secret-Token') != secret:
+                return web.Response(status=403)
+            try:
+                update = _json_loads(await request.read())
+            except Exception:
+                return web.Response(status=400)
+            # 처리 완료를 기다리지 않고 즉시 200 응답
+            task = asyncio.create_task(self._bounded_handle(update))
+            self._update_tasks.add(task)
+            task.add_done_callback(self._update_tasks.discard)
+            return web.Response()
+
+        app = web.Application()
+        app.router.add_post(path, handle)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        try:
+            site = web.TCPSite(runner, bind, port)
+            await site.start()
+
+            status, result = await self._call_api(
+                'setWebhook',
+                data={
+                    "url": self.config.webhook_url.rstrip('/') + path,
+                    "secret_token": secret,
+                    "allowed_updates": _ALLOWED_UPDATES,
+                },
+            )
+            if status != 200:
+                logger.error("텔레그램 웹훅 등록 실패: %s", result)
+                await runner.cleanup()
+                return False
+        except Exception as e:
+            logger.error("텔레그램 웹훅 시작 실패: %s", e)
+            await runner.cleanup()
+            return False
+
+        self._webhook_runner = runner
+        logger.info("텔레그램 웹훅 수신 시작 (%s:%s)", bind, port)
+        return True
+
+    async def _delete_webhook(self):
+        """등록된 웹훅 해제 (웹훅이 남아 있으면 getUpdates가 409로 실패함)"""
+        try:
+            await self._call_api('deleteWebhook')
+        except Exception as e:
+            logger.error("텔레그램 웹훅 해제 실패: %s", e)
+
+    async def _answer_callback_query(self, callback_query_id: str, text: str = None):
         """콜백 쿼리 응답 (버튼 클릭 시 로딩 해제)"""
         try:
-            url = f"{self.base_url}/answerCallbackQuery"
             data = {"callback_query_id": callback_query_id}
             if text:
                 data["text"] = text
-            requests.post(url, data=data, timeout=5)
+            await self._call_api('answerCallbackQuery', data=data, timeout=5)
         except Exception as e:
-            logger.error(f"콜백 쿼리 응답 실패: {e}")
+            logger.error("콜백 쿼리 응답 실패: %s", e)
 
     async def _handle_update(self, update: dict):
         """업데이트 처리"""
@@ -457,15 +1021,23 @@ class TelegramBot:
         if callback_query:
             callback_id = callback_query.get('id')
             callback_data = callback_query.get('data', '')
-            chat_id = str(callback_query.get('message', {}).get('chat', {}).get('id', ''))
+            cb_message = callback_query.get('message', {})
+            chat_id = str(cb_message.get('chat', {}).get('id', ''))
 
             # 허용된 chat_id만 처리
             if chat_id != self.config.chat_id:
-                logger.warning(f"허용되지 않은 chat_id (callback): {chat_id}")
+                self._warn_unauthorized(chat_id)
                 return
 
-            # 버튼 로딩 해제
-            self._answer_callback_query(callback_id)
+            # 버튼 로딩 해제 (응답을 기다리지 않고 바로 콜백 처리 진행)
+            task = asyncio.create_task(self._answer_callback_query(callback_id))
+            self._bg_tasks.add(task)
+            task.add_done_callback(self._bg_tasks.discard)
+
+            # 같은 메시지의 같은 버튼 연타는 응답만 하고 무시 (다른 메시지의 같은 버튼은 정상 처리)
+            if self._is_duplicate_callback(chat_id, cb_message.get('message_id'), callback_data):
+                logger.debug("중복 콜백 무시: %s", callback_data)
+                return
 
             # 콜백 데이터 처리
             await self._handle_callback(callback_data)
@@ -478,158 +1050,115 @@ class TelegramBot:
 
         # 허용된 chat_id만 처리
         if chat_id and chat_id != self.config.chat_id:
-            logger.warning(f"허용되지 않은 chat_id: {chat_id}")
+            self._warn_unauthorized(chat_id)
             return
 
         # 명령어 처리
         if not text.startswith('/'):
             return
 
-        parts = text.split()
-        command = parts[0].lower()
-        args = parts[1:] if len(parts) > 1 else []
-        await self._handle_command(command, args)
+        # 명령어만 잘라내고, 인자가 있을 때만 나머지를 분리 (공백/줄바꿈/탭 모두 구분자)
+        command, *rest = text.split(maxsplit=1)
+        await self._handle_command(command.lower(), rest[0].split() if rest else None)
+
+    def _warn_unauthorized(self, chat_id: str):
+        """허용되지 않은 chat_id 경고 (chat_id별 최초 1회만 로그)"""
+        if chat_id not in self._seen_unauthorized:
+            self._seen_unauthorized[chat_id] = True
+            logger.warning("허용되지 않은 chat_id: %s (이후 같은 chat_id는 로그 생략)", chat_id)
+
+    def _is_duplicate_callback(self, chat_id: str, message_id: Optional[int], callback_data: str) -> bool:
+        """최근 _CB_DEDUP_SECONDS 내 같은 메시지의 같은 콜백이면 True, 아니면 기록 후 False"""
+        key = (chat_id, message_id, callback_data)
+        now = time.monotonic()
+        recent = self._recent_cb
+        if now - recent.get(key, -_CB_DEDUP_SECONDS) < _CB_DEDUP_SECONDS:
+            return True
+        recent[key] = now
+        return False
 
     async def _handle_callback(self, callback_data: str):
         """콜백 데이터 처리 (버튼 클릭)"""
-        if callback_data == 'menu':
-            self.send_main_menu()
-
-        elif callback_data == 'status':
-            await self._handle_command('/status')
-
-        elif callback_data == 'stats':
-            await self._handle_command('/stats')
-
-        elif callback_data == 'balance':
-            await self._handle_command('/balance')
-
-        elif callback_data == 'positions':
-            await self._handle_command('/positions')
-
-        elif callback_data == 'config':
-            await self._handle_command('/config')
-
-        elif callback_data == 'stop':
-            await self._handle_command('/stop')
-
-        # ========== 주문 시작/정지 ==========
-        elif callback_data == 'orders_enable':
-            print("[텔레그램] ★★★ 주문 시작 버튼 클릭됨", flush=True)
-            if self._enable_orders:
-                try:
-                    print("[텔레그램] enable_orders() 호출 시작", flush=True)
-                    self._enable_orders()
-                    print("[텔레그램] enable_orders() 호출 완료", flush=True)
-                    self.send_message(
-                        "✅ <b>주문 시작됨</b>\n\n"
-                        "주문이 활성화되었습니다.\n"
-                        "잠시 후 주문이 배치됩니다.",
-                        reply_markup=self._get_main_menu_keyboard()
-                    )
-                except Exception as e:
-                    logger.error(f"[텔레그램] enable_orders() 실패: {e}")
-                    self.send_message(f"❌ 주문 시작 실패: {e}", reply_markup=self._get_main_menu_keyboard())
-            else:
-                logger.warning("[텔레그램] enable_orders 콜백이 설정되지 않음")
-                self.send_message("❌ 주문 시작 기능이 설정되지 않았습니다.", reply_markup=self._get_main_menu_keyboard())
-
-        elif callback_data == 'orders_disable':
-            if self._disable_orders:
-                try:
-                    self._disable_orders()
-                    self.send_message(
-                        "⏸️ <b>주문 정지됨</b>\n\n"
-                        "주문이 비활성화되었습니다.\n"
-                        "기존 주문이 취소됩니다.",
-                        reply_markup=self._get_main_menu_keyboard()
-                    )
-                except Exception as e:
-                    self.send_message(f"❌ 주문 정지 실패: {e}", reply_markup=self._get_main_menu_keyboard())
-            else:
-                self.send_message("❌ 주문 정지 기능이 설정되지 않았습니다.", reply_markup=self._get_main_menu_keyboard())
-
-        elif callback_data == 'closeall_confirm':
-            # 청산 확인 메시지
-            if self._get_positions:
-                try:
-                    positions = self._get_positions()
-                    if not positions:
-                        self.send_message("📭 종료할 포지션이 없습니다.", reply_markup=self._get_back_to_menu_keyboard())
-                        return
-
-                    msg = "⚠️ <b>모든 포지션을 시장가로 청산하시겠습니까?</b>\n\n"
-                    total_pnl = 0
-                    for pos in positions:
-                        side_emoji = "🟢" if pos['side'] == 'long' else "🔴"
-                        pnl = pos['unrealized_pnl']
-                        total_pnl += pnl
-                        msg += f"{side_emoji} {pos['symbol']} {pos['side'].upper()} {pos['size']:.4f} (PnL: ${pnl:+,.2f})\n"
-
-                    pnl_emoji = "📈" if total_pnl >= 0 else "📉"
-                    msg += f"\n{pnl_emoji} <b>총 PnL: ${total_pnl:+,.2f}</b>"
-
-                    self.send_message(msg, reply_markup=self._get_closeall_confirm_keyboard())
-                except Exception as e:
-                    self.send_message(f"❌ 포지션 조회 실패: {e}", reply_markup=self._get_back_to_menu_keyboard())
-            else:
-                self.send_message("❌ 포지션 조회 기능이 설정되지 않았습니다.", reply_markup=self._get_back_to_menu_keyboard())
-
-        elif callback_data == 'closeall':
-            await self._handle_command('/closeall')
-
-        elif callback_data == 'setsize_menu':
-            # 주문 크기 설정 메뉴 표시
-            await self._show_setsize_menu()
-
-        elif callback_data.startswith('setsize_'):
-            # 주문 크기 변경 (30%, 50%, max)
-            await self._handle_setsize_callback(callback_data)
-
-        # ========== 설정 메뉴 ==========
-        elif callback_data == 'settings_menu':
-            await self._show_settings_menu()
-
-        elif callback_data == 'settings_leverage':
-            await self._show_leverage_menu()
-
-        elif callback_data == 'settings_strategy':
-            await self._show_strategy_menu()
-
-        elif callback_data == 'settings_distance':
-            await self._show_distance_menu()
-
-        elif callback_data == 'settings_protection':
-            await self._show_protection_menu()
+        handler = self._cb_exact.get(callback_data)
+        if handler:
+            await _maybe_await(handler())
+            return
 
-        elif callback_data == 'settings_report':
-            await self._show_report_menu()
+        verb, _, value = callback_data.rpartition('_')
+        verb_handler = self._CB_DISPATCH.get(verb)
+        if verb_handler:
+            await verb_handler(self, value)
 
-        # ========== 설정 변경 처리 ==========
-        elif callback_data.startswith('set_leverage_'):
-            await self._handle_leverage_callback(callback_data)
+    async def _handle_orders_enable(self):
+        """주문 시작 버튼 처리"""
+        print("[텔레그램] ★★★ 주문 시작 버튼 클릭됨", flush=True)
+        if self._enable_orders:
+            try:
+                print("[텔레그램] enable_orders() 호출 시작", flush=True)
+                self._enable_orders()
+                print("[텔레그램] enable_orders() 호출 완료", flush=True)
+                self.send_message(
+                    "✅ <b>주문 시작됨</b>\n\n"
+                    "주문이 활성화되었습니다.\n"
+                    "잠시 후 주문이 배치됩니다.",
+                    reply_markup=self._main_menu_markup()
+                )
+            except Exception as e:
+                logger.error("[텔레그램] enable_orders() 실패: %s", e)
+                self.send_message(f"❌ 주문 시작 실패: {e}", reply_markup=self._main_menu_markup())
+        else:
+            logger.warning("[텔레그램] enable_orders 콜백이 설정되지 않음")
+            self.send_message("❌ 주문 시작 기능이 설정되지 않았습니다.", reply_markup=self._main_menu_markup())
 
-        elif callback_data.startswith('set_strategy_'):
-            await self._handle_strategy_callback(callback_data)
+    async def _handle_orders_disable(self):
+        """주문 정지 버튼 처리"""
+        if self._disable_orders:
+            try:
+                self._disable_orders()
+                self.send_message(
+                    "⏸️ <b>주문 정지됨</b>\n\n"
+                    "주문이 비활성화되었습니다.\n"
+                    "기존 주문이 취소됩니다.",
+                    reply_markup=self._main_menu_markup()
+                )
+            except Exception as e:
+                self.send_message(f"❌ 주문 정지 실패: {e}", reply_markup=self._main_menu_markup())
+        else:
+            self.send_message("❌ 주문 정지 기능이 설정되지 않았습니다.", reply_markup=self._main_menu_markup())
 
-        elif callback_data.startswith('set_distance_'):
-            await self._handle_distance_callback(callback_data)
+    async def _show_closeall_confirm(self):
+        """포지션 청산 확인 메시지 표시"""
+        if self._get_positions:
+            try:
+                positions = await asyncio.to_thread(self._get_positions)
+                if not positions:
+                    self._send_back(_MSG_NO_POS_TO_CLOSE)
+                    return
 
-        elif callback_data.startswith('set_protection_'):
-            await self._handle_protection_callback(callback_data)
+                parts = ["⚠️ <b>모든 포지션을 시장가로 청산하시겠습니까?</b>\n\n"]
+                total_pnl = 0
+                for pos in positions:
+                    side_emoji = "🟢" if pos['side'] == 'long' else "🔴"
+                    pnl = pos['unrealized_pnl']
+                    total_pnl += pnl
+                    parts.append(f"{side_emoji} {pos['symbol']} {pos['side'].upper()} {pos['size']:.4f} (PnL: {_fmt_pnl(pnl)})\n")
 
-        elif callback_data.startswith('set_report_'):
-            await self._handle_report_callback(callback_data)
+                pnl_emoji = "📈" if total_pnl >= 0 else "📉"
+                parts.append(f"\n{pnl_emoji} <b>총 PnL: {_fmt_pnl(total_pnl)}</b>")
 
-        # ========== 연속 체결 정지 해제 ==========
-        elif callback_data == 'reset_consecutive_fill_pause':
-            await self._handle_reset_consecutive_fill_pause()
+                self.send_message("".join(parts), reply_markup=self._closeall_confirm_json)
+            except Exception as e:
+                self._send_back(f"❌ 포지션 조회 실패: {e}")
+        else:
+            self._send_back(_ERR_POSITIONS_UNSET)
 
     async def _show_setsize_menu(self):
         """주문 크기 설정 메뉴 표시"""
         if self._get_balance:
             try:
-                balance_info = self._get_balance()
+                # 잔고 조회는 REST 호출이므로 스레드에서 실행
+                balance_info = await asyncio.to_thread(self._get_balance)
+                self._last_balance_info = (time.monotonic(), balance_info)
                 available = balance_info.get('available', 0)
                 leverage = balance_info.get('leverage', 20)
                 margin_reserve = balance_info.get('margin_reserve_percent', 2)
@@ -647,29 +1176,34 @@ class TelegramBot:
                 msg = (
                     f"📐 <b>주문 크기 설정</b>\n\n"
                     f"<b>[ 현재 상태 ]</b>\n"
-                    f"• 사용 가능 마진: <code>${usable_balance:,.2f}</code>\n"
-                    f"• 최대 노출 ({leverage}x): <code>${max_exposure:,.0f}</code>\n"
-                    f"• 현재 주문 크기: <code>${current_order_size:,.0f}</code>\n\n"
+                    f"• 사용 가능 마진: <code>{_fmt_usd(usable_balance)}</code>\n"
+                    f"• 최대 노출 ({leverage}x): <code>{_fmt_usd0(max_exposure)}</code>\n"
+                    f"• 현재 주문 크기: <code>{_fmt_usd0(current_order_size)}</code>\n\n"
                     f"<b>[ 버튼 클릭 시 적용 ]</b>\n"
-                    f"• 30% 마진: <code>${size_30:,.0f}</code>/주문\n"
-                    f"• 50% 마진: <code>${size_50:,.0f}</code>/주문\n"
-                    f"• 최대 마진: <code>${size_max:,.0f}</code>/주문\n\n"
+                    f"• 30% 마진: <code>{_fmt_usd0(size_30)}</code>/주문\n"
+                    f"• 50% 마진: <code>{_fmt_usd0(size_50)}</code>/주문\n"
+                    f"• 최대 마진: <code>{_fmt_usd0(size_max)}</code>/주문\n\n"
                     f"<i>2+2 전략 기준 (4개 주문)</i>"
                 )
-                self.send_message(msg, reply_markup=self._get_order_size_keyboard())
+                self.send_message(msg, reply_markup=self._order_size_json)
             except Exception as e:
-                self.send_message(f"❌ 잔고 조회 실패: {e}", reply_markup=self._get_back_to_menu_keyboard())
+                self._send_back(f"❌ 잔고 조회 실패: {e}")
         else:
-            self.send_message("❌ 잔고 조회 기능이 설정되지 않았습니다.", reply_markup=self._get_back_to_menu_keyboard())
+            self._send_back(_ERR_BALANCE_UNSET)
 
-    async def _handle_setsize_callback(self, callback_data: str):
+    async def _handle_setsize_callback(self, value: str):
         """주문 크기 버튼 클릭 처리"""
         if not self._get_balance or not self._set_order_size:
-            self.send_message("❌ 기능이 설정되지 않았습니다.", reply_markup=self._get_back_to_menu_keyboard())
+            self._send_back("❌ 기능이 설정되지 않았습니다.")
             return
 
         try:
-            balance_info = self._get_balance()
+            # 방금 메뉴에서 조회한 잔고가 있으면 재사용
+            cached = self._last_balance_info
+            if cached and time.monotonic() - cached[0] < _BALANCE_REUSE_SECONDS:
+                balance_info = cached[1]
+            else:
+                balance_info = await asyncio.to_thread(self._get_balance)
             available = balance_info.get('available', 0)
             leverage = balance_info.get('leverage', 20)
             margin_reserve = balance_info.get('margin_reserve_percent', 2)
@@ -679,13 +1213,13 @@ class TelegramBot:
             max_exposure = usable_balance * leverage
 
             # 비율에 따른 주문 크기 계산
-            if callback_data == 'setsize_30':
+            if value == '30':
                 new_size = (max_exposure * 0.30) / 4
                 percent_str = "30%"
-            elif callback_data == 'setsize_50':
+            elif value == '50':
                 new_size = (max_exposure * 0.50) / 4
                 percent_str = "50%"
-            elif callback_data == 'setsize_max':
+            elif value == 'max':
                 new_size = max_exposure / 4
                 percent_str = "최대"
             else:
@@ -693,15 +1227,16 @@ class TelegramBot:
 
             # 최소값 검사
             if new_size < 10:
-                self.send_message(
+                self._send_back(
                     f"❌ 계산된 주문 크기 (${new_size:.0f})가 너무 작습니다.\n"
-                    f"최소 $10 이상이어야 합니다.",
-                    reply_markup=self._get_back_to_menu_keyboard()
+                    f"최소 $10 이상이어야 합니다."
                 )
                 return
 
             # 주문 크기 변경 (즉시 재배치 포함)
             result = self._set_order_size(new_size, force_rebalance=True)
+            self._last_balance_info = None
+            self._config_cache = None
             if result and result.get('success'):
                 old_size = result.get('old_size', 0)
                 required_margin = new_size / leverage
@@ -710,21 +1245,21 @@ class TelegramBot:
                 msg = (
                     f"✅ <b>주문 크기 변경 완료</b>\n\n"
                     f"• 설정: <b>{percent_str} 마진</b>\n"
-                    f"• 이전: <code>${old_size:,.0f}</code>\n"
-                    f"• 변경: <code>${new_size:,.0f}</code>\n"
-                    f"• 필요 마진: <code>${required_margin:,.2f}</code> ({leverage}x)\n\n"
+                    f"• 이전: <code>{_fmt_usd0(old_size)}</code>\n"
+                    f"• 변경: <code>{_fmt_usd0(new_size)}</code>\n"
+                    f"• 필요 마진: <code>{_fmt_usd(required_margin)}</code> ({leverage}x)\n\n"
                 )
                 if rebalanced:
                     msg += "🔄 <b>기존 주문 취소 후 새 크기로 재배치 중...</b>"
                 else:
                     msg += "⚠️ 다음 주문부터 적용됩니다."
-                self.send_message(msg, reply_markup=self._get_back_to_menu_keyboard())
+                self._send_back(msg)
             else:
                 error = result.get('error', '알 수 없는 오류') if result else '알 수 없는 오류'
-                self.send_message(f"❌ 변경 실패: {error}", reply_markup=self._get_back_to_menu_keyboard())
+                self._send_back(f"❌ 변경 실패: {error}")
 
         except Exception as e:
-            self.send_message(f"❌ 주문 크기 변경 실패: {e}", reply_markup=self._get_back_to_menu_keyboard())
+            self._send_back(f"❌ 주문 크기 변경 실패: {e}")
 
     # ========== 설정 메뉴 표시 함수들 ==========
 
@@ -744,12 +1279,12 @@ class TelegramBot:
                     f"• 리포트 주기: <code>{self._report_interval / 60:.0f}분</code>\n\n"
                     f"변경할 설정을 선택하세요:"
                 )
-                self.send_message(msg, reply_markup=self._get_settings_menu_keyboard())
+                self.send_message(msg, reply_markup=self._settings_menu_json)
             except Exception as e:
-                self.send_message(f"❌ 설정 조회 실패: {e}", reply_markup=self._get_back_to_menu_keyboard())
+                self._send_back(f"❌ 설정 조회 실패: {e}")
         else:
             self.send_message("⚙️ <b>설정 메뉴</b>\n\n변경할 설정을 선택하세요:",
-                            reply_markup=self._get_settings_menu_keyboard())
+                            reply_markup=self._settings_menu_json)
 
     async def _show_leverage_menu(self):
         """레버리지 설정 메뉴 표시"""
@@ -767,7 +1302,7 @@ class TelegramBot:
             f"⚠️ 레버리지를 높이면 수익/손실이 증가합니다.\n"
             f"동일 마진으로 더 큰 포지션을 잡을 수 있습니다."
         )
-        self.send_message(msg, reply_markup=self._get_leverage_keyboard())
+        self.send_message(msg, reply_markup=self._leverage_json)
 
     async def _show_strategy_menu(self):
         """전략 설정 메뉴 표시"""
@@ -788,7 +1323,7 @@ class TelegramBot:
             f"• 포인트 적립 효율 높음\n"
             f"• 더 넓은 가격대 커버"
         )
-        self.send_message(msg, reply_markup=self._get_strategy_keyboard())
+        self.send_message(msg, reply_markup=self._strategy_json)
 
     async def _show_distance_menu(self):
         """주문 거리 설정 메뉴 표시"""
@@ -810,7 +1345,7 @@ class TelegramBot:
             f"<b>공격적 (6-7.5bps)</b>\n"
             f"• 체결 위험 있으나 포인트 효율 극대화"
         )
-        self.send_message(msg, reply_markup=self._get_distance_keyboard())
+        self.send_message(msg, reply_markup=self._distance_json)
 
     async def _show_protection_menu(self):
         """체결 보호 설정 메뉴 표시"""
@@ -822,148 +1357,130 @@ class TelegramBot:
             f"<b>끄기</b>: 체결 상관없이 계속 운영\n"
             f"• 급변장에서 손실 위험 증가"
         )
-        self.send_message(msg, reply_markup=self._get_protection_keyboard())
+        self.send_message(msg, reply_markup=self._protection_json)
 
     async def _show_report_menu(self):
         """리포트 주기 설정 메뉴 표시"""
-        current = self._report_interval
-        if current == 0:
-            current_str = "끄기"
-        elif current < 60:
-            current_str = f"{current}초"
-        else:
-            current_str = f"{current / 60:.0f}분"
-
         msg = (
             f"📱 <b>상태 리포트 주기</b>\n\n"
-            f"현재: <code>{current_str}</code>\n\n"
+            f"현재: <code>{_report_interval_label(self._report_interval)}</code>\n\n"
             f"텔레그램으로 자동 상태 리포트를 받을 주기를 설정합니다.\n"
             f"'끄기'를 선택하면 수동 조회만 가능합니다."
         )
-        self.send_message(msg, reply_markup=self._get_report_interval_keyboard())
+        self.send_message(msg, reply_markup=self._report_interval_json)
 
     # ========== 설정 변경 핸들러 ==========
 
-    async def _handle_leverage_callback(self, callback_data: str):
+    @_safe_cb('레버리지 변경 실패')
+    async def _handle_leverage_callback(self, value: str):
         """레버리지 변경 처리"""
         if not self._set_leverage:
-            self.send_message("❌ 레버리지 변경 기능이 설정되지 않았습니다.",
-                            reply_markup=self._get_settings_menu_keyboard())
+            self.send_message(_ERR_LEV_UNSET, reply_markup=self._settings_menu_json)
             return
 
-        try:
-            leverage = int(callback_data.replace('set_leverage_', ''))
-            result = self._set_leverage(leverage)
+        leverage = int(value)
+        result = self._set_leverage(leverage)
+        self._config_cache = None
 
-            if result and result.get('success'):
-                old = result.get('old_leverage', 0)
-                new = result.get('new_leverage', leverage)
-                msg = (
-                    f"✅ <b>레버리지 변경 완료</b>\n\n"
-                    f"• 이전: <code>{old}x</code>\n"
-                    f"• 변경: <code>{new}x</code>\n\n"
-                    f"💡 주문 크기를 재설정하면 새 레버리지가 반영됩니다."
-                )
-                self.send_message(msg, reply_markup=self._get_settings_menu_keyboard())
-            else:
-                error = result.get('error', '알 수 없는 오류') if result else '알 수 없는 오류'
-                self.send_message(f"❌ 변경 실패: {error}", reply_markup=self._get_settings_menu_keyboard())
-        except Exception as e:
-            self.send_message(f"❌ 레버리지 변경 실패: {e}", reply_markup=self._get_settings_menu_keyboard())
+        if result and result.get('success'):
+            old = result.get('old_leverage', 0)
+            new = result.get('new_leverage', leverage)
+            msg = (
+                f"✅ <b>레버리지 변경 완료</b>\n\n"
+                f"• 이전: <code>{old}x</code>\n"
+                f"• 변경: <code>{new}x</code>\n\n"
+                f"💡 주문 크기를 재설정하면 새 레버리지가 반영됩니다."
+            )
+            self.send_message(msg, reply_markup=self._settings_menu_json)
+        else:
+            error = result.get('error', '알 수 없는 오류') if result else '알 수 없는 오류'
+            self.send_message(f"❌ 변경 실패: {error}", reply_markup=self._settings_menu_json)
 
-    async def _handle_strategy_callback(self, callback_data: str):
+    @_safe_cb('전략 변경 실패')
+    async def _handle_strategy_callback(self, value: str):
         """전략 변경 처리"""
         if not self._set_strategy:
-            self.send_message("❌ 전략 변경 기능이 설정되지 않았습니다.",
-                            reply_markup=self._get_settings_menu_keyboard())
+            self.send_message(_ERR_STRAT_UNSET, reply_markup=self._settings_menu_json)
             return
 
-        try:
-            num_orders = int(callback_data.replace('set_strategy_', ''))
-            result = self._set_strategy(num_orders)
+        num_orders = int(value)
+        result = self._set_strategy(num_orders)
+        self._config_cache = None
 
-            if result and result.get('success'):
-                old = result.get('old_strategy', '')
-                new = result.get('new_strategy', f'{num_orders}+{num_orders}')
-                msg = (
-                    f"✅ <b>전략 변경 완료</b>\n\n"
-                    f"• 이전: <code>{old}</code>\n"
-                    f"• 변경: <code>{new}</code>\n\n"
-                    f"🔄 기존 주문 취소 후 재배치 중..."
-                )
-                self.send_message(msg, reply_markup=self._get_settings_menu_keyboard())
-            else:
-                error = result.get('error', '알 수 없는 오류') if result else '알 수 없는 오류'
-                self.send_message(f"❌ 변경 실패: {error}", reply_markup=self._get_settings_menu_keyboard())
-        except Exception as e:
-            self.send_message(f"❌ 전략 변경 실패: {e}", reply_markup=self._get_settings_menu_keyboard())
+        if result and result.get('success'):
+            old = result.get('old_strategy', '')
+            new = result.get('new_strategy', f'{num_orders}+{num_orders}')
+            msg = (
+                f"✅ <b>전략 변경 완료</b>\n\n"
+                f"• 이전: <code>{old}</code>\n"
+                f"• 변경: <code>{new}</code>\n\n"
+                f"🔄 기존 주문 취소 후 재배치 중..."
+            )
+            self.send_message(msg, reply_markup=self._settings_menu_json)
+        else:
+            error = result.get('error', '알 수 없는 오류') if result else '알 수 없는 오류'
+            self.send_message(f"❌ 변경 실패: {error}", reply_markup=self._settings_menu_json)
 
-    async def _handle_distance_callback(self, callback_data: str):
+    @_safe_cb('주문 거리 변경 실패')
+    async def _handle_distance_callback(self, value: str):
         """주문 거리 변경 처리"""
         if not self._set_distances:
-            self.send_message("❌ 주문 거리 변경 기능이 설정되지 않았습니다.",
-                            reply_markup=self._get_settings_menu_keyboard())
+            self.send_message(_ERR_DIST_UNSET, reply_markup=self._settings_menu_json)
             return
 
-        try:
-            preset = callback_data.replace('set_distance_', '')
-            preset_names = {
-                'conservative': '보수적 (8-9bps)',
-                'standard': '표준 (7-8.5bps)',
-                'aggressive': '공격적 (6-7.5bps)',
-            }
-            result = self._set_distances(preset)
+        preset = value
+        preset_names = {
+            'conservative': '보수적 (8-9bps)',
+            'standard': '표준 (7-8.5bps)',
+            'aggressive': '공격적 (6-7.5bps)',
+        }
+        result = self._set_distances(preset)
+        self._config_cache = None
 
-            if result and result.get('success'):
-                old = result.get('old_distances', [])
-                new = result.get('new_distances', [])
-                preset_name = preset_names.get(preset, preset)
-                msg = (
-                    f"✅ <b>주문 거리 변경 완료</b>\n\n"
-                    f"• 설정: <b>{preset_name}</b>\n"
-                    f"• 이전: <code>{old} bps</code>\n"
-                    f"• 변경: <code>{new} bps</code>\n\n"
-                    f"🔄 기존 주문 취소 후 재배치 중..."
-                )
-                self.send_message(msg, reply_markup=self._get_settings_menu_keyboard())
-            else:
-                error = result.get('error', '알 수 없는 오류') if result else '알 수 없는 오류'
-                self.send_message(f"❌ 변경 실패: {error}", reply_markup=self._get_settings_menu_keyboard())
-        except Exception as e:
-            self.send_message(f"❌ 주문 거리 변경 실패: {e}", reply_markup=self._get_settings_menu_keyboard())
+        if result and result.get('success'):
+            old = result.get('old_distances', [])
+            new = result.get('new_distances', [])
+            preset_name = preset_names.get(preset, preset)
+            msg = (
+                f"✅ <b>주문 거리 변경 완료</b>\n\n"
+                f"• 설정: <b>{preset_name}</b>\n"
+                f"• 이전: <code>{old} bps</code>\n"
+                f"• 변경: <code>{new} bps</code>\n\n"
+                f"🔄 기존 주문 취소 후 재배치 중..."
+            )
+            self.send_message(msg, reply_markup=self._settings_menu_json)
+        else:
+            error = result.get('error', '알 수 없는 오류') if result else '알 수 없는 오류'
+            self.send_message(f"❌ 변경 실패: {error}", reply_markup=self._settings_menu_json)
 
-    async def _handle_protection_callback(self, callback_data: str):
+    @_safe_cb('체결 보호 설정 실패')
+    async def _handle_protection_callback(self, value: str):
         """체결 보호 설정 처리"""
         if not self._set_protection:
-            self.send_message("❌ 체결 보호 설정 기능이 설정되지 않았습니다.",
-                            reply_markup=self._get_settings_menu_keyboard())
+            self.send_message(_ERR_PROT_UNSET, reply_markup=self._settings_menu_json)
             return
 
-        try:
-            enabled = callback_data == 'set_protection_on'
-            result = self._set_protection(enabled)
+        enabled = value == 'on'
+        result = self._set_protection(enabled)
 
-            if result and result.get('success'):
-                status = "켜짐 ✅" if enabled else "꺼짐 ❌"
-                msg = (
-                    f"✅ <b>연속 체결 보호 변경 완료</b>\n\n"
-                    f"• 상태: <b>{status}</b>\n"
-                )
-                if not enabled:
-                    msg += "\n⚠️ 급변장에서 연속 체결 시 손실 위험이 있습니다."
-                self.send_message(msg, reply_markup=self._get_settings_menu_keyboard())
-            else:
-                error = result.get('error', '알 수 없는 오류') if result else '알 수 없는 오류'
-                self.send_message(f"❌ 변경 실패: {error}", reply_markup=self._get_settings_menu_keyboard())
-        except Exception as e:
-            self.send_message(f"❌ 체결 보호 설정 실패: {e}", reply_markup=self._get_settings_menu_keyboard())
+        if result and result.get('success'):
+            status = "켜짐 ✅" if enabled else "꺼짐 ❌"
+            msg = (
+                f"✅ <b>연속 체결 보호 변경 완료</b>\n\n"
+                f"• 상태: <b>{status}</b>\n"
+            )
+            if not enabled:
+                msg += "\n⚠️ 급변장에서 연속 체결 시 손실 위험이 있습니다."
+            self.send_message(msg, reply_markup=self._settings_menu_json)
+        else:
+            error = result.get('error', '알 수 없는 오류') if result else '알 수 없는 오류'
+            self.send_message(f"❌ 변경 실패: {error}", reply_markup=self._settings_menu_json)
 
     async def _handle_reset_consecutive_fill_pause(self):
         """연속 체결 정지 수동 해제"""
         if not self._reset_consecutive_fill_pause:
-            self.send_message(
-                "❌ 정지 해제 기능이 설정되지 않았습니다.",
-                reply_markup=self._get_back_to_menu_keyboard()
+            self._send_back(
+                "❌ 정지 해제 기능이 설정되지 않았습니다."
             )
             return
 
@@ -978,7 +1495,7 @@ class TelegramBot:
                     self.send_message(
                         "ℹ️ <b>현재 정지 상태가 아닙니다</b>\n\n"
                         "연속 체결 보호가 발동되지 않은 상태입니다.",
-                        reply_markup=self._get_main_menu_keyboard()
+                        reply_markup=self._main_menu_markup()
                     )
                     return
 
@@ -996,291 +1513,295 @@ class TelegramBot:
                     f"⚠️ 주의: 시장 상황을 확인 후 주문을 시작하세요.\n"
                     f"연속 체결이 다시 발생하면 정지됩니다."
                 )
-                self.send_message(msg, reply_markup=self._get_main_menu_keyboard())
+                self.send_message(msg, reply_markup=self._main_menu_markup())
             else:
-                self.send_message(
-                    "❌ 정지 해제 실패",
-                    reply_markup=self._get_back_to_menu_keyboard()
+                self._send_back(
+                    "❌ 정지 해제 실패"
                 )
         except Exception as e:
-            self.send_message(
-                f"❌ 정지 해제 실패: {e}",
-                reply_markup=self._get_back_to_menu_keyboard()
+            self._send_back(
+                f"❌ 정지 해제 실패: {e}"
             )
 
-    async def _handle_report_callback(self, callback_data: str):
+    @_safe_cb('리포트 주기 변경 실패')
+    async def _handle_report_callback(self, value: str):
         """리포트 주기 변경 처리"""
+        interval = int(value)
+        self._report_interval = float(interval)
+
+        msg = (
+            f"✅ <b>리포트 주기 변경 완료</b>\n\n"
+            f"• 주기: <b>{_report_interval_label(interval)}</b>\n"
+        )
+        if interval == 0:
+            msg += "\n💡 /status 명령으로 수동 조회하세요."
+        self.send_message(msg, reply_markup=self._settings_menu_json)
+
+    # "<동작>_<값>" 형태 콜백: 마지막 '_' 기준으로 분리해 동작별 핸들러(언바운드)에 값 전달
+    _CB_DISPATCH: Dict[str, Callable[..., Awaitable]] = {
+        'setsize': _handle_setsize_callback,  # 주문 크기 변경 (30%, 50%, max)
+        'set_leverage': _handle_leverage_callback,
+        'set_strategy': _handle_strategy_callback,
+        'set_distance': _handle_distance_callback,
+        'set_protection': _handle_protection_callback,
+        'set_report': _handle_report_callback,
+    }
+
+    async def _handle_command(self, command: str, args: list = None):
+        """명령어 처리"""
+        handler = self._commands.get(command)
+        if handler:
+            await handler(args or [])
+        else:
+            self.send_message(f"❓ 알 수 없는 명령어: {command}\n/help 로 도움말을 확인하세요.")
+
+    # ========== 명령어 핸들러 ==========
+
+    @_safe_handler('상태 조회 실패')
+    async def _cmd_status(self, args: list):
+        """/status: 상태 리포트"""
+        if not self._get_status:
+            self._send_back("❌ 상태 조회 기능이 설정되지 않았습니다.")
+            return
+        status = self._get_status()
+        self.send_status_report(status)
+
+    @_safe_handler('통계 조회 실패')
+    async def _cmd_stats(self, args: list):
+        """/stats: 통계"""
+        if not self._get_stats:
+            self._send_back("❌ 통계 조회 기능이 설정되지 않았습니다.")
+            return
+        stats = self._get_stats()
+        msg = (
+            f"📈 <b>통계</b>\n\n"
+            f"주문 생성: {stats.get('orders_placed', 0)}건\n"
+            f"주문 취소: {stats.get('orders_cancelled', 0)}건\n"
+            f"재배치: {stats.get('rebalances', 0)}회\n"
+            f"체결: {stats.get('fills', 0)}건\n"
+            f"예상 포인트: {stats.get('estimated_points', 0):.1f}"
+        )
+        self._send_back(msg)
+
+    @_safe_handler('잔고 조회 실패')
+    async def _cmd_balance(self, args: list):
+        """/balance: 잔고 및 주문 가능 금액"""
+        if not self._get_balance:
+            self._send_back(_ERR_BALANCE_UNSET)
+            return
+        balance_info = await asyncio.to_thread(self._get_balance)
+        available = balance_info.get('available', 0)
+        equity = balance_info.get('equity', 0)
+        leverage = balance_info.get('leverage', 20)
+        margin_reserve = balance_info.get('margin_reserve_percent', 2)
+        current_order_size = balance_info.get('current_order_size', 0)
+
+        # 20x 레버리지로 주문 가능 금액 계산
+        usable_balance = available * (1 - margin_reserve / 100)
+        max_exposure = usable_balance * leverage
+
+        # 2+2 전략 (4개 주문) 기준 주문당 크기
+        recommended_per_order = max_exposure / 4
+
+        msg = (
+            f"💰 <b>잔고 및 주문 계산</b>\n\n"
+            f"<b>[ 계좌 잔고 ]</b>\n"
+            f"• 사용 가능: <code>{_fmt_usd(available)}</code>\n"
+            f"• 총 자산: <code>{_fmt_usd(equity)}</code>\n\n"
+            f"<b>[ {leverage}x 레버리지 계산 ]</b>\n"
+            f"• 마진 예약: {margin_reserve}%\n"
+            f"• 사용 가능 마진: <code>{_fmt_usd(usable_balance)}</code>\n"
+            f"• 최대 노출 금액: <code>{_fmt_usd(max_exposure)}</code>\n\n"
+            f"<b>[ 추천 주문 크기 (2+2 전략) ]</b>\n"
+            f"• 주문당 크기: <code>{_fmt_usd0(recommended_per_order)}</code>\n"
+            f"• 현재 설정: <code>{_fmt_usd0(current_order_size)}</code>\n\n"
+            f"💡 <i>/setsize {recommended_per_order:.0f} 로 변경 가능</i>"
+        )
+        self._send_back(msg)
+
+    @_safe_handler('주문 크기 변경 실패')
+    async def _cmd_setsize(self, args: list):
+        """/setsize <금액>: 주문 크기 변경"""
+        if not args:
+            self._send_back(
+                "⚠️ <b>사용법</b>: /setsize <금액>\n\n"
+                "예시: /setsize 3000\n"
+                "(레버리지 적용 후 주문당 노출 금액)"
+            )
+            return
+
+        if not self._set_order_size:
+            self._send_back("❌ 주문 크기 변경 기능이 설정되지 않았습니다.")
+            return
+
         try:
-            interval = int(callback_data.replace('set_report_', ''))
-            self._report_interval = float(interval)
+            new_size = float(args[0])
+        except ValueError:
+            self._send_back("❌ 잘못된 금액 형식입니다. 숫자만 입력하세요.")
+            return
+        if new_size < 10:
+            self._send_back("❌ 주문 크기는 최소 $10 이상이어야 합니다.")
+            return
+        if new_size > 100000:
+            self._send_back("❌ 주문 크기가 너무 큽니다 (최대 $100,000).")
+            return
 
-            if interval == 0:
-                interval_str = "끄기"
-            elif interval < 60:
-                interval_str = f"{interval}초"
-            else:
-                interval_str = f"{interval / 60:.0f}분"
+        result = self._set_order_size(new_size)
+        self._config_cache = None
+        if result.get('success'):
+            old_size = result.get('old_size', 0)
+            leverage = result.get('leverage', 20)
+            required_margin = new_size / leverage
 
             msg = (
-                f"✅ <b>리포트 주기 변경 완료</b>\n\n"
-                f"• 주기: <b>{interval_str}</b>\n"
+                f"✅ <b>주문 크기 변경 완료</b>\n\n"
+                f"• 이전: <code>{_fmt_usd0(old_size)}</code>\n"
+                f"• 변경: <code>{_fmt_usd0(new_size)}</code>\n"
+                f"• 필요 마진: <code>{_fmt_usd(required_margin)}</code> ({leverage}x)\n\n"
+                f"⚠️ 다음 주문부터 적용됩니다."
             )
-            if interval == 0:
-                msg += "\n💡 /status 명령으로 수동 조회하세요."
-            self.send_message(msg, reply_markup=self._get_settings_menu_keyboard())
-        except Exception as e:
-            self.send_message(f"❌ 리포트 주기 변경 실패: {e}", reply_markup=self._get_settings_menu_keyboard())
-
-    async def _handle_command(self, command: str, args: list = None):
-        """명령어 처리"""
-        args = args or []
+            self._send_back(msg)
+        else:
+            self._send_back(f"❌ 변경 실패: {result.get('error', '알 수 없는 오류')}")
 
-        if command == '/status':
-            if self._get_status:
-                try:
-                    status = self._get_status()
-                    self.send_status_report(status)
-                except Exception as e:
-                    self.send_message(f"❌ 상태 조회 실패: {e}", reply_markup=self._get_back_to_menu_keyboard())
-            else:
-                self.send_message("❌ 상태 조회 기능이 설정되지 않았습니다.", reply_markup=self._get_back_to_menu_keyboard())
+    @_safe_handler('설정 조회 실패')
+    async def _cmd_config(self, args: list):
+        """/config: 현재 설정"""
+        if not self._get_config:
+            self._send_back("❌ 설정 조회 기능이 설정되지 않았습니다.")
+            return
 
-        elif command == '/stats':
-            if self._get_stats:
-                try:
-                    stats = self._get_stats()
-                    msg = (
-                        f"📈 <b>통계</b>\n\n"
-                        f"주문 생성: {stats.get('orders_placed', 0)}건\n"
-                        f"주문 취소: {stats.get('orders_cancelled', 0)}건\n"
-                        f"재배치: {stats.get('rebalances', 0)}회\n"
-                        f"체결: {stats.get('fills', 0)}건\n"
-                        f"예상 포인트: {stats.get('estimated_points', 0):.1f}"
-                    )
-                    self.send_message(msg, reply_markup=self._get_back_to_menu_keyboard())
-                except Exception as e:
-                    self.send_message(f"❌ 통계 조회 실패: {e}", reply_markup=self._get_back_to_menu_keyboard())
-            else:
-                self.send_message("❌ 통계 조회 기능이 설정되지 않았습니다.", reply_markup=self._get_back_to_menu_keyboard())
+        cached = self._config_cache
+        if cached and time.monotonic() - cached[0] < _CONFIG_CACHE_SECONDS:
+            self._send_back(cached[1])
+            return
 
-        elif command == '/balance':
-            if self._get_balance:
-                try:
-                    balance_info = self._get_balance()
-                    available = balance_info.get('available', 0)
-                    equity = balance_info.get('equity', 0)
-                    leverage = balance_info.get('leverage', 20)
-                    margin_reserve = balance_info.get('margin_reserve_percent', 2)
-                    current_order_size = balance_info.get('current_order_size', 0)
-
-                    # 20x 레버리지로 주문 가능 금액 계산
-                    usable_balance = available * (1 - margin_reserve / 100)
-                    max_exposure = usable_balance * leverage
-
-                    # 2+2 전략 (4개 주문) 기준 주문당 크기
-                    recommended_per_order = max_exposure / 4
-
-                    msg = (
-                        f"💰 <b>잔고 및 주문 계산</b>\n\n"
-                        f"<b>[ 계좌 잔고 ]</b>\n"
-                        f"• 사용 가능: <code>${available:,.2f}</code>\n"
-                        f"• 총 자산: <code>${equity:,.2f}</code>\n\n"
-                        f"<b>[ {leverage}x 레버리지 계산 ]</b>\n"
-                        f"• 마진 예약: {margin_reserve}%\n"
-                        f"• 사용 가능 마진: <code>${usable_balance:,.2f}</code>\n"
-                        f"• 최대 노출 금액: <code>${max_exposure:,.2f}</code>\n\n"
-                        f"<b>[ 추천 주문 크기 (2+2 전략) ]</b>\n"
-                        f"• 주문당 크기: <code>${recommended_per_order:,.0f}</code>\n"
-                        f"• 현재 설정: <code>${current_order_size:,.0f}</code>\n\n"
-                        f"💡 <i>/setsize {recommended_per_order:.0f} 로 변경 가능</i>"
-                    )
-                    self.send_message(msg, reply_markup=self._get_back_to_menu_keyboard())
-                except Exception as e:
-                    self.send_message(f"❌ 잔고 조회 실패: {e}", reply_markup=self._get_back_to_menu_keyboard())
-            else:
-                self.send_message("❌ 잔고 조회 기능이 설정되지 않았습니다.", reply_markup=self._get_back_to_menu_keyboard())
+        config = self._get_config()
+        strategy = config.get('strategy', {})
+        safety = config.get('safety', {})
 
-        elif command == '/setsize':
-            if not args:
-                self.send_message(
-                    "⚠️ <b>사용법</b>: /setsize <금액>\n\n"
-                    "예시: /setsize 3000\n"
-                    "(레버리지 적용 후 주문당 노출 금액)",
-                    reply_markup=self._get_back_to_menu_keyboard()
-                )
-                return
+        msg = (
+            f"⚙️ <b>현재 설정</b>\n\n"
+            f"<b>[ 전략 설정 ]</b>\n"
+            f"• 심볼: {', '.join(strategy.get('symbols', []))}\n"
+            f"• 레버리지: {strategy.get('leverage', 20)}x\n"
+            f"• 주문 크기: <code>{_fmt_usd0(strategy.get('order_size_usd', 0))}</code>\n"
+            f"• 마진 예약: {strategy.get('margin_reserve_percent', 2)}%\n"
+            f"• 전략: {strategy.get('num_orders_per_side', 2)}+{strategy.get('num_orders_per_side', 2)}\n"
+            f"• 주문 거리: {strategy.get('order_distances_bps', [])} bps\n\n"
+            f"<b>[ 안전 설정 ]</b>\n"
+            f"• 최대 포지션: <code>{_fmt_usd0(safety.get('max_position_usd', 0))}</code>\n\n"
+            f"💡 <i>/setsize <금액> 으로 주문 크기 변경</i>"
+        )
+        self._config_cache = (time.monotonic(), msg)
+        self._send_back(msg)
+
+    @_safe_handler('포지션 조회 실패')
+    async def _cmd_positions(self, args: list):
+        """/positions: 현재 포지션"""
+        if not self._get_positions:
+            self._send_back(_ERR_POSITIONS_UNSET)
+            return
+        positions = await asyncio.to_thread(self._get_positions)
+        if not positions:
+            self._send_back(_MSG_NO_POS)
+            return
 
-            if self._set_order_size:
-                try:
-                    new_size = float(args[0])
-                    if new_size < 10:
-                        self.send_message("❌ 주문 크기는 최소 $10 이상이어야 합니다.", reply_markup=self._get_back_to_menu_keyboard())
-                        return
-                    if new_size > 100000:
-                        self.send_message("❌ 주문 크기가 너무 큽니다 (최대 $100,000).", reply_markup=self._get_back_to_menu_keyboard())
-                        return
-
-                    result = self._set_order_size(new_size)
-                    if result.get('success'):
-                        old_size = result.get('old_size', 0)
-                        leverage = result.get('leverage', 20)
-                        required_margin = new_size / leverage
-
-                        msg = (
-                            f"✅ <b>주문 크기 변경 완료</b>\n\n"
-                            f"• 이전: <code>${old_size:,.0f}</code>\n"
-                            f"• 변경: <code>${new_size:,.0f}</code>\n"
-                            f"• 필요 마진: <code>${required_margin:,.2f}</code> ({leverage}x)\n\n"
-                            f"⚠️ 다음 주문부터 적용됩니다."
-                        )
-                        self.send_message(msg, reply_markup=self._get_back_to_menu_keyboard())
-                    else:
-                        self.send_message(f"❌ 변경 실패: {result.get('error', '알 수 없는 오류')}", reply_markup=self._get_back_to_menu_keyboard())
-                except ValueError:
-                    self.send_message("❌ 잘못된 금액 형식입니다. 숫자만 입력하세요.", reply_markup=self._get_back_to_menu_keyboard())
-                except Exception as e:
-                    self.send_message(f"❌ 주문 크기 변경 실패: {e}", reply_markup=self._get_back_to_menu_keyboard())
-            else:
-                self.send_message("❌ 주문 크기 변경 기능이 설정되지 않았습니다.", reply_markup=self._get_back_to_menu_keyboard())
+        parts = [_HDR_POSITIONS]
+        total_pnl = 0
+        for pos in positions:
+            side_emoji = "🟢" if pos['side'] == 'long' else "🔴"
+            pnl = pos['unrealized_pnl']
+            total_pnl += pnl
+            pnl_emoji = "📈" if pnl >= 0 else "📉"
+
+            parts.append(
+                f"{side_emoji} <b>{pos['symbol']}</b> {pos['side'].upper()}\n"
+                f"   크기: <code>{pos['size']:.4f}</code>\n"
+                f"   진입가: <code>{_fmt_usd(pos['entry_price'])}</code>\n"
+                f"   현재가: <code>{_fmt_usd(pos['mark_price'])}</code>\n"
+                f"   {pnl_emoji} PnL: <code>{_fmt_pnl(pnl)}</code>\n\n"
+            )
 
-        elif command == '/config':
-            if self._get_config:
-                try:
-                    config = self._get_config()
-                    strategy = config.get('strategy', {})
-                    safety = config.get('safety', {})
-
-                    msg = (
-                        f"⚙️ <b>현재 설정</b>\n\n"
-                        f"<b>[ 전략 설정 ]</b>\n"
-                        f"• 심볼: {', '.join(strategy.get('symbols', []))}\n"
-                        f"• 레버리지: {strategy.get('leverage', 20)}x\n"
-                        f"• 주문 크기: <code>${strategy.get('order_size_usd', 0):,.0f}</code>\n"
-                        f"• 마진 예약: {strategy.get('margin_reserve_percent', 2)}%\n"
-                        f"• 전략: {strategy.get('num_orders_per_side', 2)}+{strategy.get('num_orders_per_side', 2)}\n"
-                        f"• 주문 거리: {strategy.get('order_distances_bps', [])} bps\n\n"
-                        f"<b>[ 안전 설정 ]</b>\n"
-                        f"• 최대 포지션: <code>${safety.get('max_position_usd', 0):,.0f}</code>\n\n"
-                        f"💡 <i>/setsize <금액> 으로 주문 크기 변경</i>"
-                    )
-                    self.send_message(msg, reply_markup=self._get_back_to_menu_keyboard())
-                except Exception as e:
-                    self.send_message(f"❌ 설정 조회 실패: {e}", reply_markup=self._get_back_to_menu_keyboard())
-            else:
-                self.send_message("❌ 설정 조회 기능이 설정되지 않았습니다.", reply_markup=self._get_back_to_menu_keyboard())
+        pnl_emoji = "📈" if total_pnl >= 0 else "📉"
+        parts.append(_SEP)
+        parts.append(f"{pnl_emoji} <b>총 PnL: <code>{_fmt_pnl(total_pnl)}</code></b>")
+        self._send_back("".join(parts))
 
-        elif command == '/positions':
-            if self._get_positions:
-                try:
-                    positions = self._get_positions()
-                    if not positions:
-                        self.send_message("📭 현재 열린 포지션이 없습니다.", reply_markup=self._get_back_to_menu_keyboard())
-                        return
-
-                    msg = "📊 <b>현재 포지션</b>\n\n"
-                    total_pnl = 0
-                    for pos in positions:
-                        side_emoji = "🟢" if pos['side'] == 'long' else "🔴"
-                        pnl = pos['unrealized_pnl']
-                        total_pnl += pnl
-                        pnl_emoji = "📈" if pnl >= 0 else "📉"
-
-                        msg += (
-                            f"{side_emoji} <b>{pos['symbol']}</b> {pos['side'].upper()}\n"
-                            f"   크기: <code>{pos['size']:.4f}</code>\n"
-                            f"   진입가: <code>${pos['entry_price']:,.2f}</code>\n"
-                            f"   현재가: <code>${pos['mark_price']:,.2f}</code>\n"
-                            f"   {pnl_emoji} PnL: <code>${pnl:+,.2f}</code>\n\n"
-                        )
-
-                    pnl_emoji = "📈" if total_pnl >= 0 else "📉"
-                    msg += f"━━━━━━━━━━━━━━\n{pnl_emoji} <b>총 PnL: <code>${total_pnl:+,.2f}</code></b>"
-                    self.send_message(msg, reply_markup=self._get_back_to_menu_keyboard())
-                except Exception as e:
-                    self.send_message(f"❌ 포지션 조회 실패: {e}", reply_markup=self._get_back_to_menu_keyboard())
-            else:
-                self.send_message("❌ 포지션 조회 기능이 설정되지 않았습니다.", reply_markup=self._get_back_to_menu_keyboard())
-
-        elif command == '/closeall':
-            if self._close_all_positions:
-                # 먼저 현재 포지션 확인
-                if self._get_positions:
-                    try:
-                        positions = self._get_positions()
-                        if not positions:
-                            self.send_message("📭 종료할 포지션이 없습니다.", reply_markup=self._get_back_to_menu_keyboard())
-                            return
-
-                        # 포지션 정보 표시
-                        msg = "⚠️ <b>다음 포지션을 시장가로 종료합니다:</b>\n\n"
-                        for pos in positions:
-                            side_emoji = "🟢" if pos['side'] == 'long' else "🔴"
-                            msg += f"{side_emoji} {pos['symbol']} {pos['side'].upper()} {pos['size']:.4f}\n"
-                        msg += "\n⏳ 모든 주문 취소 후 포지션 종료 중..."
-                        self.send_message(msg)
-                    except Exception as e:
-                        logger.error(f"포지션 확인 실패: {e}")
-
-                # ★ 먼저 모든 주문 비활성화 (주문 취소됨)
-                if self._disable_orders:
-                    try:
-                        self._disable_orders()
-                        logger.info("[포지션청산] 주문 비활성화 완료")
-                    except Exception as e:
-                        logger.error(f"주문 비활성화 실패: {e}")
-
-                # 포지션 종료 실행
-                try:
-                    result = self._close_all_positions()
-                    if result.get('success'):
-                        closed = result.get('closed', [])
-                        if closed:
-                            msg = "✅ <b>포지션 종료 완료</b>\n\n"
-                            msg += "• 모든 주문 취소됨\n"
-                            for c in closed:
-                                msg += f"• {c['symbol']}: {c['side']} {c['size']:.4f} 종료\n"
-                            self.send_message(msg, reply_markup=self._get_back_to_menu_keyboard())
-                        else:
-                            self.send_message("📭 종료할 포지션이 없었습니다.\n• 모든 주문 취소됨", reply_markup=self._get_back_to_menu_keyboard())
-                    else:
-                        error = result.get('error', '알 수 없는 오류')
-                        self.send_message(f"❌ 포지션 종료 실패: {error}\n• 주문은 취소됨", reply_markup=self._get_back_to_menu_keyboard())
-                except Exception as e:
-                    self.send_message(f"❌ 포지션 종료 실패: {e}", reply_markup=self._get_back_to_menu_keyboard())
-            else:
-                self.send_message("❌ 포지션 종료 기능이 설정되지 않았습니다.", reply_markup=self._get_back_to_menu_keyboard())
+    @_safe_handler('포지션 종료 실패')
+    async def _cmd_closeall(self, args: list):
+        """/closeall: 모든 주문 취소 후 포지션 시장가 종료"""
+        if not self._close_all_positions:
+            self._send_back("❌ 포지션 종료 기능이 설정되지 않았습니다.")
+            return
 
-        elif command == '/stop':
-            if self._on_stop:
-                self.send_message("🛑 모든 주문 취소 후 봇 중지 중...")
+        # 먼저 현재 포지션 확인
+        if self._get_positions:
+            try:
+                positions = await asyncio.to_thread(self._get_positions)
+                if not positions:
+                    self._send_back(_MSG_NO_POS_TO_CLOSE)
+                    return
 
-                # ★ 먼저 모든 주문 비활성화 (주문 취소됨)
-                if self._disable_orders:
-                    try:
-                        self._disable_orders()
-                        logger.info("[봇종료] 주문 비활성화 완료")
-                    except Exception as e:
-                        logger.error(f"주문 비활성화 실패: {e}")
+                # 포지션 정보 표시
+                parts = ["⚠️ <b>다음 포지션을 시장가로 종료합니다:</b>\n\n"]
+                for pos in positions:
+                    side_emoji = "🟢" if pos['side'] == 'long' else "🔴"
+                    parts.append(f"{side_emoji} {pos['symbol']} {pos['side'].upper()} {pos['size']:.4f}\n")
+                parts.append("\n⏳ 모든 주문 취소 후 포지션 종료 중...")
+                self.send_message("".join(parts))
+            except Exception as e:
+                logger.error("포지션 확인 실패: %s", e)
 
-                try:
-                    await self._on_stop()
-                    self.send_message("✅ 봇이 중지되었습니다.\n• 모든 주문 취소됨", reply_markup=self._get_back_to_menu_keyboard())
-                except Exception as e:
-                    self.send_message(f"❌ 봇 중지 실패: {e}", reply_markup=self._get_back_to_menu_keyboard())
+        # ★ 먼저 모든 주문 비활성화 (주문 취소됨, 루프에서 직접 호출 - set_callbacks 참고)
+        if self._disable_orders:
+            try:
+                self._disable_orders()
+                logger.info("[포지션청산] 주문 비활성화 완료")
+            except Exception as e:
+                logger.error("주문 비활성화 실패: %s", e)
+
+        # 포지션 종료 실행
+        result = await asyncio.to_thread(self._close_all_positions)
+        if result.get('success'):
+            closed = result.get('closed', [])
+            if closed:
+                parts = ["✅ <b>포지션 종료 완료</b>\n\n", "• 모든 주문 취소됨\n"]
+                parts.extend(f"• {c['symbol']}: {c['side']} {c['size']:.4f} 종료\n" for c in closed)
+                self._send_back("".join(parts))
             else:
-                self.send_message("❌ 중지 기능이 설정되지 않았습니다.", reply_markup=self._get_back_to_menu_keyboard())
+                self._send_back("📭 종료할 포지션이 없었습니다.\n• 모든 주문 취소됨")
+        else:
+            error = result.get('error', '알 수 없는 오류')
+            self._send_back(f"❌ 포지션 종료 실패: {error}\n• 주문은 취소됨")
+
+    @_safe_handler('봇 중지 실패')
+    async def _cmd_stop(self, args: list):
+        """/stop: 모든 주문 취소 후 봇 중지"""
+        if not self._on_stop:
+            self._send_back("❌ 중지 기능이 설정되지 않았습니다.")
+            return
 
-        elif command == '/start' or command == '/help' or command == '/menu':
-            # /start, /help, /menu 모두 메인 메뉴 표시
-            self.send_main_menu()
+        self.send_message("🛑 모든 주문 취소 후 봇 중지 중...")
 
-        else:
-            self.send_message(f"❓ 알 수 없는 명령어: {command}\n/help 로 도움말을 확인하세요.")
+        # ★ 먼저 모든 주문 비활성화 (주문 취소됨)
+        if self._disable_orders:
+            try:
+                self._disable_orders()
+                logger.info("[봇종료] 주문 비활성화 완료")
+            except Exception as e:
+                logger.error("주문 비활성화 실패: %s", e)
+
+        await self._on_stop()
+        self._send_back("✅ 봇이 중지되었습니다.\n• 모든 주문 취소됨")
+
+    async def _cmd_menu(self, args: list):
+        """/start, /help, /menu: 메인 메뉴 표시"""
+        self.send_main_menu()
 
-    def _set_bot_commands(self):
+    async def _set_bot_commands(self):
         """봇 명령어 목록 등록 (/ 입력 시 힌트 표시)"""
         try:
-            url = f"{self.base_url}/setMyCommands"
             commands = [
                 {"command": "start", "description": "메인 메뉴 표시"},
                 {"command": "menu", "description": "메인 메뉴 표시"},
@@ -1293,14 +1814,13 @@ class TelegramBot:
                 {"command": "closeall", "description": "모든 포지션 시장가 청산"},
                 {"command": "stop", "description": "봇 중지"},
             ]
-            import json
-            response = requests.post(url, json={"commands": commands}, timeout=10)
-            if response.status_code == 200:
+            status, result = await self._call_api('setMyCommands', json={"commands": commands})
+            if status == 200:
                 logger.info("텔레그램 봇 명령어 목록 등록 완료")
             else:
-                logger.warning(f"텔레그램 명령어 등록 실패: {response.text}")
+                logger.warning("텔레그램 명령어 등록 실패: %s", result)
         except Exception as e:
-            logger.error(f"텔레그램 명령어 등록 실패: {e}")
+            logger.error("텔레그램 명령어 등록 실패: %s", e)
 
     async def start(self):
         """텔레그램 봇 시작"""
@@ -1309,10 +1829,16 @@ class TelegramBot:
             return
 
         # 봇 명령어 목록 등록
-        self._set_bot_commands()
+        await self._set_bot_commands()
 
         self._running = True
-        self._poll_task = asyncio.create_task(self._poll_updates())
+        self._send_task = asyncio.create_task(self._sender())
+        self._error_task = asyncio.create_task(self._error_flusher())
+
+        # 웹훅 주소가 있으면 웹훅, 없거나 실패하면 롱폴링
+        if not (self.config.webhook_url and await self.run_webhook()):
+            await self._delete_webhook()
+            self._poll_task = asyncio.create_task(self._poll_updates())
         logger.info("텔레그램 봇 시작")
         self.send_startup_message()
 
@@ -1325,39 +1851,171 @@ class TelegramBot:
                 await self._poll_task
             except asyncio.CancelledError:
                 pass
+        if self._webhook_runner:
+            await self._webhook_runner.cleanup()
+            self._webhook_runner = None
+        # 웹훅으로 받아 처리 중인 업데이트도 롱폴링과 같이 취소 (세션 종료 후 새 세션을 만들지 않도록)
+        if self._update_tasks:
+            for task in self._update_tasks:
+                task.cancel()
+            await asyncio.gather(*self._update_tasks, return_exceptions=True)
+
+        # 모아 둔 오류 알림은 전송 큐로 넘기고 종료
+        if self._error_task:
+            self._error_task.cancel()
+            try:
+                await self._error_task
+            except asyncio.CancelledError:
+                pass
+            self._error_task = None
+        self._flush_errors()
+
+        # start() 전에 쌓인 메시지 (시작 실패 시 오류/종료 알림 등)도 여기서 전송
+        if self._send_task is None and not self._send_queue.empty():
+            self._send_task = asyncio.create_task(self._sender())
+
+        if self._send_task:
+            # 남은 메시지 (종료 알림 등) 전송 대기
+            try:
+                await asyncio.wait_for(self._send_queue.join(), timeout=5)
+            except asyncio.TimeoutError:
+                logger.warning("텔레그램 전송 큐 비우기 시간 초과")
+            self._send_task.cancel()
+            try:
+                await self._send_task
+            except asyncio.CancelledError:
+                pass
+            self._send_task = None
+
+        # 진행 중인 콜백 응답 마무리 (세션 종료 전)
+        if self._bg_tasks:
+            await asyncio.gather(*self._bg_tasks, return_exceptions=True)
+
+        if self._session:
+            await self._session.close()
+            self._session = None
         logger.info("텔레그램 봇 중지")
 
 
 class TelegramNotifier:
     """
     간단한 텔레그램 알림 전송기
-    (명령어 처리 없이 알림만 전송)
+    (명령어 처리 없이 알림만 전송, 전용 스레드에서 비동기 전송)
+
+    프로세스 종료 시 atexit으로 flush()를 호출해 남은 알림을 보내고 끝낸다.
     """
 
     def __init__(self, bot_token: str, chat_id: str):
         self.bot_token = bot_token
         self.chat_id = chat_id
         self.base_url = f"https://api.telegram.org/bot{bot_token}"
+        self._send_url = f"{self.base_url}/sendMessage"
+
+        # keep-alive 세션 (재시도는 호출 측에서 처리하므로 비활성화)
+        self._http = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=_HTTP_POOL_SIZE,
+            pool_maxsize=_HTTP_POOL_SIZE,
+            max_retries=Retry(total=0),
+        )
+        self._http.mount('https://', adapter)
+
+        # 최근 전송한 오류 ((타입, 메시지) -> monotonic 시각), 반복 전송 억제용
+        self._recent_errors: _LRU = _LRU(_ERROR_DEDUP_MAX)
+        self._recent_errors_lock = threading.Lock()  # send_error는 여러 스레드에서 호출될 수 있음
+
+        # 전송은 전용 데몬 스레드에서 처리 (호출 측은 큐에 넣고 바로 반환)
+        self._q: "queue.Queue[Tuple[str, str]]" = queue.Queue(maxsize=_NOTIFIER_QUEUE_SIZE)
+        self._dropped = 0
+        self._thread = threading.Thread(target=self._worker, name="telegram-notifier", daemon=True)
+        self._thread.start()
+        atexit.register(self.flush)
 
     def send(self, text: str, parse_mode: str = "HTML") -> bool:
-        """메시지 전송"""
+        """메시지 전송 예약 (큐가 가득 차면 가장 오래된 메시지를 버림)"""
+        item = (text, parse_mode)
+        while True:
+            try:
+                self._q.put_nowait(item)
+                return True
+            except queue.Full:
+                try:
+                    self._q.get_nowait()
+                except queue.Empty:
+                    continue
+                self._q.task_done()
+                self._dropped += 1
+                if self._dropped % _NOTIFIER_DROP_LOG_EVERY == 1:
+                    logger.warning("텔레그램 알림 큐 가득 참 - 누적 %s건 버림", self._dropped)
+
+    def _worker(self):
+        """전송 스레드: 큐에서 꺼내 채팅당 속도 제한을 지키며 전송"""
+        interval = 1.0 / _SEND_RATE
+        last_sent = 0.0
+        while True:
+            text, parse_mode = self._q.get()
+            wait = interval - (time.monotonic() - last_sent)
+            if wait > 0:
+                time.sleep(wait)
+            retry_after = self._post(text, parse_mode)
+            if retry_after:
+                # 429: 안내받은 시간만큼 쉬고 한 번 더 시도
+                time.sleep(retry_after)
+                self._post(text, parse_mode)
+            last_sent = time.monotonic()
+            self._q.task_done()
+
+    def flush(self, timeout: float = _NOTIFIER_FLUSH_TIMEOUT) -> bool:
+        """대기 중인 알림이 모두 전송될 때까지 최대 timeout초 대기 (다 보냈으면 True)"""
+        q = self._q
+        deadline = time.monotonic() + timeout
+        with q.all_tasks_done:
+            while q.unfinished_tasks:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    logger.warning("텔레그램 알림 전송 대기 시간 초과 - %s건 미전송", q.unfinished_tasks)
+                    return False
+                q.all_tasks_done.wait(remaining)
+        return True
+
+    def _post(self, text: str, parse_mode: str) -> float:
+        """
+        sendMessage 호출
+
+        Returns:
+            429 응답이면 retry_after(초), 그 외 0
+        """
         try:
-            url = f"{self.base_url}/sendMessage"
             data = {
                 "chat_id": self.chat_id,
                 "text": text,
                 "parse_mode": parse_mode,
             }
-            response = requests.post(url, data=data, timeout=10)
-            return response.status_code == 200
+            if len(text) <= _GET_MAX_TEXT:
+                response = self._http.get(self._send_url, params=data, timeout=10)
+            else:
+                response = self._http.post(self._send_url, data=data, timeout=10)
+            if response.status_code == 429:
+                try:
+                    body = _json_loads(response.content)
+                except ValueError:
+                    body = {}
+                return TelegramBot._get_retry_after(body)
+            if response.status_code != 200:
+                logger.error("텔레그램 전송 실패: HTTP %s", response.status_code)
         except Exception as e:
-            logger.error(f"텔레그램 전송 실패: {e}")
-            return False
+            logger.error("텔레그램 전송 실패: %s", e)
+        return 0.0
 
     def send_error(self, error: Exception):
-        """오류 전송"""
-        tb = traceback.format_exc()
-        if len(tb) > 1000:
-            tb = tb[:1000] + "..."
+        """오류 전송 (같은 오류가 _ERROR_DEDUP_SECONDS 내 반복되면 생략)"""
+        key = (type(error), str(error))
+        now = time.monotonic()
+        with self._recent_errors_lock:
+            if now - self._recent_errors.get(key, -_ERROR_DEDUP_SECONDS) < _ERROR_DEDUP_SECONDS:
+                return
+            self._recent_errors[key] = now
+
+        tb = _truncate(traceback.format_exc(), _NOTIFIER_MAX_TB)
         msg = f"❌ <b>오류 발생</b>\n\n<code>{str(error)}</code>\n\n<pre>{tb}</pre>"
         self.send(msg)